@@ -1,15 +1,84 @@
 import re
+import sys
 import json
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
+def _keyword_re(*keywords: str) -> re.Pattern:
+    """Compile keywords into one alternation with plain substring semantics."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# Keyword heuristics used by NLPProcessor._classify_query_type
+_DAY_PREDICTION_RE = _keyword_re('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'end of day', 'eod')
+_RETURN_PREDICTION_RE = _keyword_re('returns', 'performance', 'movement', 'direction')
+_NEWS_RE = _keyword_re('news', 'announcement', 'earnings', 'report')
+_PORTFOLIO_RE = _keyword_re('portfolio', 'diversification', 'allocation')
+_RISK_RE = _keyword_re('risk', 'volatility', 'danger', 'safe')
+_QUESTION_WORD_RE = _keyword_re('which', 'what', 'how', 'when', 'where', 'why', 'who')
+_SP500_RE = _keyword_re('s&p', 'sp500', 's&p 500', 'standard & poor')
+
+# Weekday mention that switches ConversationalAgent to the day-specific prediction
+_WEEKDAY_RE = _keyword_re('monday', 'tuesday', 'wednesday', 'thursday', 'friday')
+
+# Literal stems required by ConversationalAgent.financial_advisor_patterns (keep in sync)
+_ADVISOR_PREFILTER_RE = _keyword_re(
+    'plan', 'profile', 'strategy', 'retire', 'assessment', 'tolerance', 'tax', 'allocation',
+    'diversification', 'portfolio', 'investment', 'fund', 'savings', 'debt', 'loan', 'insurance',
+    'coverage', 'financial', 'money', 'wealth', 'income', 'salary', 'worth', 'assets',
+    'conservative', 'moderate', 'aggressive', 'term'
+)
+
+# Goal extraction used by NLPProcessor._extract_goal_parameters
+_MONEY_RE = re.compile(r'(\$|usd\s*)?(\d+[\d,]*)')
+# Drops thousands separators and upper-cases the K/M suffix in one pass
+_MONEY_TABLE = str.maketrans({',': None, 'k': 'K', 'm': 'M'})
+_TIME_HORIZON_RE = re.compile(r'(\d+\s*(day|week|month|year|days|weeks|months|years))')
+
+# Tokenizer used by SentimentAnalyzer.analyze_sentiment. ASCII text is split by
+# mapping every non-word character to a space, which yields the same tokens as
+# _WORD_RE; other text falls back to the regex so Unicode word rules still apply.
+_WORD_RE = re.compile(r'\b\w+\b')
+_NON_WORD_TABLE = str.maketrans({chr(c): ' ' for c in range(128) if not (chr(c).isalnum() or chr(c) == '_')})
+
+# Fixed SentimentResult summaries, interned so every result shares one object
+_SUMMARY_NONE = sys.intern("No sentiment detected")
+_SUMMARY_STRONG_POSITIVE = sys.intern("Strongly positive sentiment detected")
+_SUMMARY_MODERATE_POSITIVE = sys.intern("Moderately positive sentiment detected")
+_SUMMARY_STRONG_NEGATIVE = sys.intern("Strongly negative sentiment detected")
+_SUMMARY_MODERATE_NEGATIVE = sys.intern("Moderately negative sentiment detected")
+_SUMMARY_NEUTRAL = sys.intern("Neutral sentiment detected")
+_SUMMARY_MIXED = sys.intern("Mixed sentiment detected with conflicting signals")
+
+# Sentiment vocabularies shared by SentimentAnalyzer instances
+_POSITIVE_WORDS = frozenset([
+    'bullish', 'positive', 'optimistic', 'strong', 'growth', 'up', 'rise',
+    'gain', 'profit', 'success', 'excellent', 'great', 'good', 'buy',
+    'outperform', 'beat', 'exceed', 'surge', 'rally', 'breakout',
+    'robust', 'solid', 'impressive', 'outstanding', 'superior', 'premium'
+])
+
+_NEGATIVE_WORDS = frozenset([
+    'bearish', 'negative', 'pessimistic', 'weak', 'decline', 'down', 'fall',
+    'loss', 'drop', 'crash', 'plunge', 'sell', 'underperform', 'miss',
+    'disappoint', 'concern', 'risk', 'volatile', 'uncertain',
+    'poor', 'terrible', 'awful', 'disaster', 'failure', 'struggle'
+])
+
+_NEUTRAL_WORDS = frozenset([
+    'stable', 'steady', 'neutral', 'mixed', 'balanced', 'moderate',
+    'average', 'normal', 'consistent', 'maintain', 'hold', 'flat',
+    'unchanged', 'sideways', 'consolidation'
+])
+
 class QueryType(Enum):
     """Types of user queries."""
     PRICE_QUERY = "price_query"
@@ -43,6 +112,7 @@ class QueryIntent:
     investment_amount: Optional[float] = None
     target_amount: Optional[float] = None
     time_horizon: Optional[str] = None
+    lower_query: str = ''  # raw_query lowercased once by NLPProcessor.parse_query
 
 @dataclass
 class SentimentResult:
@@ -121,23 +191,6 @@ class NLPProcessor:
             '5y': r'\b(5\s+years|long\s+term)\b'
         }
         
-        self.sentiment_keywords = {
-            'positive': [
-                'bullish', 'positive', 'optimistic', 'strong', 'growth', 'up', 'rise',
-                'gain', 'profit', 'success', 'excellent', 'great', 'good', 'buy',
-                'outperform', 'beat', 'exceed', 'surge', 'rally', 'breakout'
-            ],
-            'negative': [
-                'bearish', 'negative', 'pessimistic', 'weak', 'decline', 'down', 'fall',
-                'loss', 'drop', 'crash', 'plunge', 'sell', 'underperform', 'miss',
-                'disappoint', 'concern', 'risk', 'volatile', 'uncertain'
-            ],
-            'neutral': [
-                'stable', 'steady', 'neutral', 'mixed', 'balanced', 'moderate',
-                'average', 'normal', 'consistent', 'maintain', 'hold'
-            ]
-        }
-
         self.goal_patterns = [
             r'(invest|grow|turn|make|reach|achieve|increase|double|triple|quadruple)[^\d$]*(\$?\d+[\d,]*)([^\d$]+)?(to|into|and|reach|become)[^\d$]*(\$?\d+[\d,]*)',
             r'(grow|turn|make|reach|achieve|increase|double|triple|quadruple)[^\d$]*(\$?\d+[\d,]*)[^\d$]+(in|within|over|by)[^\d$]*(\d+\s*(day|week|month|year|days|weeks|months|years))',
@@ -152,7 +205,7 @@ class NLPProcessor:
         symbols = self._extract_symbols(query)
         
         # Determine query type
-        query_type = self._classify_query_type(query_lower)
+        query_type, pattern_hits = self._classify_query_type(query_lower)
         
         # Extract time period
         time_period = self._extract_time_period(query_lower)
@@ -161,13 +214,13 @@ class NLPProcessor:
         indicators = self._extract_indicators(query_lower)
         
         # Check for sentiment focus
-        sentiment_focus = any(re.search(pattern, query_lower) for pattern in self.sentiment_patterns)
+        sentiment_focus = pattern_hits[QueryType.SENTIMENT_ANALYSIS] > 0
         
         # Check for comparison mode
-        comparison_mode = any(re.search(pattern, query_lower) for pattern in self.comparison_patterns)
+        comparison_mode = pattern_hits[QueryType.COMPARISON] > 0
         
         # Calculate confidence
-        confidence = self._calculate_confidence(query_lower, query_type, symbols)
+        confidence = self._calculate_confidence(query_lower, query_type, symbols, pattern_hits)
 
         # Extract investment/target/time horizon
         investment_amount, target_amount, time_horizon = self._extract_goal_parameters(query_lower)
@@ -183,7 +236,8 @@ class NLPProcessor:
             raw_query=query,
             investment_amount=investment_amount,
             target_amount=target_amount,
-            time_horizon=time_horizon
+            time_horizon=time_horizon,
+            lower_query=query_lower
         )
     
     def _extract_symbols(self, query: str) -> List[str]:
@@ -221,40 +275,23 @@ class NLPProcessor:
         
         return symbols
     
-    def _classify_query_type(self, query: str) -> QueryType:
-        """Classify the type of query."""
-        scores = {
-            QueryType.PRICE_QUERY: 0,
-            QueryType.TECHNICAL_ANALYSIS: 0,
-            QueryType.PREDICTION: 0,
-            QueryType.SENTIMENT_ANALYSIS: 0,
-            QueryType.COMPARISON: 0,
-            QueryType.NEWS_QUERY: 0,
-            QueryType.PORTFOLIO_ANALYSIS: 0,
-            QueryType.RISK_ASSESSMENT: 0,
-            QueryType.GENERAL_QUESTION: 0
+    def _classify_query_type(self, query: str) -> Tuple[QueryType, Dict[QueryType, int]]:
+        """Classify the type of query (expects an already lowercased query).
+
+        Returns the winning query type together with the number of regex
+        patterns that matched for each pattern-scored category, so callers
+        can reuse the hits instead of running the same patterns again.
+        """
+        pattern_hits = {
+            QueryType.PRICE_QUERY: sum(1 for pattern in self.price_patterns if re.search(pattern, query)),
+            QueryType.TECHNICAL_ANALYSIS: sum(1 for pattern in self.technical_patterns if re.search(pattern, query)),
+            QueryType.PREDICTION: sum(1 for pattern in self.prediction_patterns if re.search(pattern, query)),
+            QueryType.SENTIMENT_ANALYSIS: sum(1 for pattern in self.sentiment_patterns if re.search(pattern, query)),
+            QueryType.COMPARISON: sum(1 for pattern in self.comparison_patterns if re.search(pattern, query)),
         }
         
         # Score based on patterns
-        for pattern in self.price_patterns:
-            if re.search(pattern, query):
-                scores[QueryType.PRICE_QUERY] += 1
-        
-        for pattern in self.technical_patterns:
-            if re.search(pattern, query):
-                scores[QueryType.TECHNICAL_ANALYSIS] += 1
-        
-        for pattern in self.prediction_patterns:
-            if re.search(pattern, query):
-                scores[QueryType.PREDICTION] += 1
-        
-        for pattern in self.sentiment_patterns:
-            if re.search(pattern, query):
-                scores[QueryType.SENTIMENT_ANALYSIS] += 1
-        
-        for pattern in self.comparison_patterns:
-            if re.search(pattern, query):
-                scores[QueryType.COMPARISON] += 1
+        scores = {query_type: pattern_hits.get(query_type, 0) for query_type in QueryType}
         
         # Check for recommendation patterns
         for pattern in self.recommendation_patterns:
@@ -267,32 +304,32 @@ class NLPProcessor:
                 scores[QueryType.GENERAL_QUESTION] += 5  # Much higher weight for list requests
         
         # Check for specific prediction patterns with higher priority
-        if any(word in query.lower() for word in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'end of day', 'eod']):
+        if _DAY_PREDICTION_RE.search(query):
             scores[QueryType.PREDICTION] += 3  # Higher priority for specific day predictions
         
-        if any(word in query.lower() for word in ['returns', 'performance', 'movement', 'direction']):
+        if _RETURN_PREDICTION_RE.search(query):
             scores[QueryType.PREDICTION] += 2  # Higher priority for return predictions
         
         # Additional heuristics
-        if any(word in query for word in ['news', 'announcement', 'earnings', 'report']):
+        if _NEWS_RE.search(query):
             scores[QueryType.NEWS_QUERY] += 1
         
-        if any(word in query for word in ['portfolio', 'diversification', 'allocation']):
+        if _PORTFOLIO_RE.search(query):
             scores[QueryType.PORTFOLIO_ANALYSIS] += 1
         
-        if any(word in query for word in ['risk', 'volatility', 'danger', 'safe']):
+        if _RISK_RE.search(query):
             scores[QueryType.RISK_ASSESSMENT] += 1
         
         # Check for general question words
-        if any(word in query.lower() for word in ['which', 'what', 'how', 'when', 'where', 'why', 'who']):
+        if _QUESTION_WORD_RE.search(query):
             scores[QueryType.GENERAL_QUESTION] += 1
         
         # Check for S&P 500 specific patterns
-        if any(phrase in query.lower() for phrase in ['s&p', 'sp500', 's&p 500', 'standard & poor']):
+        if _SP500_RE.search(query):
             scores[QueryType.GENERAL_QUESTION] += 3
         
         # Return the highest scoring type
-        return max(scores.items(), key=lambda x: x[1])[0]
+        return max(scores.items(), key=lambda x: x[1])[0], pattern_hits
     
     def _extract_time_period(self, query: str) -> Optional[str]:
         """Extract time period from query."""
@@ -324,7 +361,8 @@ class NLPProcessor:
         
         return indicators
     
-    def _calculate_confidence(self, query: str, query_type: QueryType, symbols: List[str]) -> float:
+    def _calculate_confidence(self, query: str, query_type: QueryType, symbols: List[str],
+                              pattern_hits: Dict[QueryType, int]) -> float:
         """Calculate confidence in the query classification."""
         confidence = 0.5  # Base confidence
         
@@ -332,14 +370,14 @@ class NLPProcessor:
         if symbols:
             confidence += 0.2
         
-        # Boost confidence based on query type patterns
-        if query_type == QueryType.PRICE_QUERY and any(re.search(pattern, query) for pattern in self.price_patterns):
+        # Boost confidence based on query type patterns (hits come from classification)
+        if query_type == QueryType.PRICE_QUERY and pattern_hits[QueryType.PRICE_QUERY] > 0:
             confidence += 0.2
         
-        if query_type == QueryType.TECHNICAL_ANALYSIS and any(re.search(pattern, query) for pattern in self.technical_patterns):
+        if query_type == QueryType.TECHNICAL_ANALYSIS and pattern_hits[QueryType.TECHNICAL_ANALYSIS] > 0:
             confidence += 0.2
         
-        if query_type == QueryType.PREDICTION and any(re.search(pattern, query) for pattern in self.prediction_patterns):
+        if query_type == QueryType.PREDICTION and pattern_hits[QueryType.PREDICTION] > 0:
             confidence += 0.2
         
         return min(confidence, 1.0)
@@ -349,15 +387,14 @@ class NLPProcessor:
         investment_amount = None
         target_amount = None
         time_horizon = None
-        # Find all numbers with $ or usd
-        money_matches = re.findall(r'(\$|usd\s*)?(\d+[\d,]*)', query)
-        numbers = [float(m[1].replace(',', '')) for m in money_matches if m[1]]
+        # Only the first two money amounts are used, so stop scanning after them
+        numbers = [float(m.group(2).replace(',', '')) for m in islice(_MONEY_RE.finditer(query), 2)]
         if numbers:
             investment_amount = numbers[0]
             if len(numbers) > 1:
                 target_amount = numbers[1]
         # Find time horizon (e.g., 1 month, 30 days)
-        time_match = re.search(r'(\d+\s*(day|week|month|year|days|weeks|months|years))', query)
+        time_match = _TIME_HORIZON_RE.search(query)
         if time_match:
             time_horizon = time_match.group(1)
         return investment_amount, target_amount, time_horizon
@@ -366,29 +403,17 @@ class SentimentAnalyzer:
     """Sentiment analysis for stock-related text."""
     
     def __init__(self):
-        self.positive_words = set([
-            'bullish', 'positive', 'optimistic', 'strong', 'growth', 'up', 'rise',
-            'gain', 'profit', 'success', 'excellent', 'great', 'good', 'buy',
-            'outperform', 'beat', 'exceed', 'surge', 'rally', 'breakout', 'strong',
-            'robust', 'solid', 'impressive', 'outstanding', 'superior', 'premium'
-        ])
-        
-        self.negative_words = set([
-            'bearish', 'negative', 'pessimistic', 'weak', 'decline', 'down', 'fall',
-            'loss', 'drop', 'crash', 'plunge', 'sell', 'underperform', 'miss',
-            'disappoint', 'concern', 'risk', 'volatile', 'uncertain', 'weak',
-            'poor', 'terrible', 'awful', 'disaster', 'failure', 'struggle'
-        ])
-        
-        self.neutral_words = set([
-            'stable', 'steady', 'neutral', 'mixed', 'balanced', 'moderate',
-            'average', 'normal', 'consistent', 'maintain', 'hold', 'flat',
-            'unchanged', 'sideways', 'consolidation'
-        ])
+        self.positive_words = _POSITIVE_WORDS
+        self.negative_words = _NEGATIVE_WORDS
+        self.neutral_words = _NEUTRAL_WORDS
     
     def analyze_sentiment(self, text: str) -> SentimentResult:
         """Analyze sentiment of given text."""
-        words = re.findall(r'\b\w+\b', text.lower())
+        text_lower = text.lower()
+        if text_lower.isascii():
+            words = text_lower.translate(_NON_WORD_TABLE).split()
+        else:
+            words = _WORD_RE.findall(text_lower)
         
         positive_count = sum(1 for word in words if word in self.positive_words)
         negative_count = sum(1 for word in words if word in self.negative_words)
@@ -403,7 +428,7 @@ class SentimentAnalyzer:
                 negative_score=0.0,
                 neutral_score=1.0,
                 keywords=[],
-                summary="No sentiment detected"
+                summary=_SUMMARY_NONE
             )
         
         positive_score = positive_count / total_words
@@ -448,32 +473,488 @@ class SentimentAnalyzer:
         """Generate a summary of the sentiment analysis."""
         if sentiment == SentimentType.POSITIVE:
             if confidence > 0.7:
-                return "Strongly positive sentiment detected"
+                return _SUMMARY_STRONG_POSITIVE
             else:
-                return "Moderately positive sentiment detected"
+                return _SUMMARY_MODERATE_POSITIVE
         elif sentiment == SentimentType.NEGATIVE:
             if confidence > 0.7:
-                return "Strongly negative sentiment detected"
+                return _SUMMARY_STRONG_NEGATIVE
             else:
-                return "Moderately negative sentiment detected"
+                return _SUMMARY_MODERATE_NEGATIVE
         elif sentiment == SentimentType.NEUTRAL:
-            return "Neutral sentiment detected"
+            return _SUMMARY_NEUTRAL
         else:
-            return "Mixed sentiment detected with conflicting signals"
+            return _SUMMARY_MIXED
+
+# Canned responses used by ConversationalAgent._generate_response
+_ETF_RECOMMENDATION_RESPONSE = (
+    "Here are some of the best ETFs to consider for different investment strategies:\n\n"
+    "**📈 Broad Market ETFs (Core Holdings):**\n"
+    "• **SPY** - SPDR S&P 500 ETF (Large-cap US stocks)\n"
+    "• **VOO** - Vanguard S&P 500 ETF (Lower expense ratio)\n"
+    "• **VTI** - Vanguard Total Stock Market ETF (Complete US market)\n"
+    "• **QQQ** - Invesco QQQ Trust (Technology-heavy)\n\n"
+    "**🌍 International ETFs (Diversification):**\n"
+    "• **VXUS** - Vanguard Total International Stock ETF\n"
+    "• **EFA** - iShares MSCI EAFE ETF (Developed markets)\n"
+    "• **EEM** - iShares MSCI Emerging Markets ETF\n\n"
+    "**💰 Bond ETFs (Income & Stability):**\n"
+    "• **BND** - Vanguard Total Bond Market ETF\n"
+    "• **AGG** - iShares Core U.S. Aggregate Bond ETF\n"
+    "• **TLT** - iShares 20+ Year Treasury Bond ETF\n\n"
+    "**🏠 Sector ETFs (Targeted Exposure):**\n"
+    "• **XLK** - Technology Select Sector SPDR Fund\n"
+    "• **XLF** - Financial Select Sector SPDR Fund\n"
+    "• **XLE** - Energy Select Sector SPDR Fund\n"
+    "• **VNQ** - Vanguard Real Estate ETF\n\n"
+    "**💡 Recommended Strategy:**\n"
+    "• **Conservative:** 60% BND + 25% VOO + 15% VXUS\n"
+    "• **Moderate:** 40% VOO + 20% VXUS + 25% BND + 15% QQQ\n"
+    "• **Aggressive:** 50% VOO + 20% QQQ + 15% VXUS + 15% sector ETFs\n\n"
+    "Would you like me to create a personalized ETF portfolio based on your financial profile?"
+)
+
+_ETF_INFO_RESPONSE = (
+    "ETFs (Exchange-Traded Funds) are investment funds that trade on stock exchanges like individual stocks. They offer:\n\n"
+    "**✅ Advantages:**\n"
+    "• Diversification across many stocks/bonds\n"
+    "• Lower expense ratios than mutual funds\n"
+    "• Tax efficiency\n"
+    "• Easy to buy/sell\n"
+    "• Transparent holdings\n\n"
+    "**📊 Popular Categories:**\n"
+    "• **Index ETFs:** Track market indices (SPY, VOO)\n"
+    "• **Sector ETFs:** Focus on specific sectors (XLK, XLF)\n"
+    "• **International ETFs:** Global diversification (VXUS, EFA)\n"
+    "• **Bond ETFs:** Fixed income exposure (BND, AGG)\n\n"
+    "Would you like me to recommend specific ETFs based on your investment goals and risk tolerance?"
+)
+
+_LONG_TERM_STRATEGY_RESPONSE = (
+    "**📈 Long-Term Investment Strategy (10+ years):**\n\n"
+    "**1. Asset Allocation by Age:**\n"
+    "• **20s-30s:** 80-90% stocks, 10-20% bonds\n"
+    "• **40s-50s:** 60-80% stocks, 20-40% bonds\n"
+    "• **60s+:** 40-60% stocks, 40-60% bonds\n\n"
+    "**2. Core Holdings:**\n"
+    "• **VTI** - Total US Stock Market (40-50%)\n"
+    "• **VXUS** - Total International Stocks (20-30%)\n"
+    "• **BND** - Total Bond Market (20-30%)\n\n"
+    "**3. Dollar-Cost Averaging:**\n"
+    "• Invest regularly (monthly/quarterly)\n"
+    "• Reduces timing risk\n"
+    "• Automates the process\n\n"
+    "**4. Tax-Efficient Accounts:**\n"
+    "• Max out 401(k) and IRA contributions\n"
+    "• Use Roth accounts for tax-free growth\n"
+    "• Consider HSA for healthcare expenses\n\n"
+    "**5. Rebalancing:**\n"
+    "• Review annually\n"
+    "• Rebalance when allocations drift >5%\n"
+    "• Maintain target risk level\n\n"
+    "Would you like me to create a personalized long-term investment plan?"
+)
+
+_SHORT_TERM_STRATEGY_RESPONSE = (
+    "**⚡ Short-Term Trading Strategy (Days to Months):**\n\n"
+    "**⚠️ Important:** Short-term trading is high-risk and requires significant time and knowledge.\n\n"
+    "**1. High-Liquidity Stocks:**\n"
+    "• **SPY** - S&P 500 ETF (High volume)\n"
+    "• **QQQ** - Nasdaq ETF (Tech focus)\n"
+    "• **AAPL, MSFT, GOOGL** - Large-cap tech\n"
+    "• **TSLA, NVDA** - High volatility\n\n"
+    "**2. Technical Analysis:**\n"
+    "• Moving averages (20, 50, 200-day)\n"
+    "• RSI for overbought/oversold\n"
+    "• MACD for momentum\n"
+    "• Support/resistance levels\n\n"
+    "**3. Risk Management:**\n"
+    "• Set stop-loss orders (2-3% max loss)\n"
+    "• Never risk more than 1-2% per trade\n"
+    "• Use position sizing\n"
+    "• Have an exit strategy\n\n"
+    "**4. Market Timing:**\n"
+    "• Trade during market hours (9:30 AM - 4:00 PM ET)\n"
+    "• Avoid earnings announcements\n"
+    "• Watch for market catalysts\n\n"
+    "**💡 Recommendation:** Consider long-term investing instead, as it's more reliable and less stressful."
+)
+
+_DIVERSIFICATION_RESPONSE = (
+    "**🌍 Portfolio Diversification Strategy:**\n\n"
+    "**1. Asset Class Diversification:**\n"
+    "• **Stocks:** 60-80% (Growth potential)\n"
+    "• **Bonds:** 20-40% (Stability & income)\n"
+    "• **Real Estate:** 5-15% (Inflation hedge)\n"
+    "• **Commodities:** 0-10% (Diversification)\n\n"
+    "**2. Geographic Diversification:**\n"
+    "• **US Stocks:** 50-70% (Home bias)\n"
+    "• **International Developed:** 20-30% (Europe, Japan)\n"
+    "• **Emerging Markets:** 5-15% (Growth potential)\n\n"
+    "**3. Sector Diversification:**\n"
+    "• **Technology:** 15-25%\n"
+    "• **Healthcare:** 10-15%\n"
+    "• **Financial:** 10-15%\n"
+    "• **Consumer:** 10-15%\n"
+    "• **Other sectors:** 35-55%\n\n"
+    "**4. Company Size Diversification:**\n"
+    "• **Large-cap:** 40-60% (Stability)\n"
+    "• **Mid-cap:** 20-30% (Growth)\n"
+    "• **Small-cap:** 10-20% (High growth potential)\n\n"
+    "**5. Investment Vehicles:**\n"
+    "• **ETFs:** Easy diversification\n"
+    "• **Index funds:** Low-cost broad exposure\n"
+    "• **Individual stocks:** Targeted positions\n"
+    "• **Bonds:** Government and corporate\n\n"
+    "Would you like me to analyze your current portfolio and suggest diversification improvements?"
+)
+
+_GETTING_STARTED_RESPONSE = (
+    "**🚀 Getting Started with Investing:**\n\n"
+    "**Step 1: Build Emergency Fund**\n"
+    "• Save 3-6 months of expenses\n"
+    "• Keep in high-yield savings account\n"
+    "• Don't invest until this is complete\n\n"
+    "**Step 2: Pay Off High-Interest Debt**\n"
+    "• Credit cards (15-25% interest)\n"
+    "• Personal loans\n"
+    "• Student loans (if >6%)\n\n"
+    "**Step 3: Choose Investment Account**\n"
+    "• **401(k):** Employer-sponsored (tax-advantaged)\n"
+    "• **IRA:** Individual retirement account\n"
+    "• **Roth IRA:** Tax-free growth (if eligible)\n"
+    "• **Taxable account:** For additional investments\n\n"
+    "**Step 4: Start with Index Funds**\n"
+    "• **VTI** - Total US Stock Market\n"
+    "• **VOO** - S&P 500 Index\n"
+    "• **BND** - Total Bond Market\n\n"
+    "**Step 5: Dollar-Cost Averaging**\n"
+    "• Invest regularly (monthly)\n"
+    "• Start with $100-500/month\n"
+    "• Increase as you earn more\n\n"
+    "**Step 6: Set Investment Goals**\n"
+    "• Retirement (long-term)\n"
+    "• House down payment (medium-term)\n"
+    "• Emergency fund (short-term)\n\n"
+    "**💡 Beginner Portfolio:**\n"
+    "• 70% VTI (US stocks)\n"
+    "• 20% VXUS (International stocks)\n"
+    "• 10% BND (Bonds)\n\n"
+    "Would you like me to help you create a personalized investment plan?"
+)
+
+_DEFAULT_HELP_RESPONSE = (
+    "I can help you with comprehensive financial planning and investment analysis. Here are some things I can assist with:\n\n"
+    "**📊 Investment Analysis:**\n"
+    "• Stock predictions and technical analysis\n"
+    "• ETF recommendations and portfolio building\n"
+    "• Risk assessment and diversification\n\n"
+    "**💰 Financial Planning:**\n"
+    "• Retirement planning and savings strategies\n"
+    "• Tax-efficient investment strategies\n"
+    "• Debt management and emergency fund planning\n\n"
+    "**🎯 Personalized Advice:**\n"
+    "• Create financial profiles and plans\n"
+    "• Asset allocation recommendations\n"
+    "• Investment goal setting\n\n"
+    "What would you like to focus on today?"
+)
+
+# Keyword routing for the canned responses above. Rules are tried in order; within a
+# rule the first choice whose qualifier matches (None always matches) is returned, and
+# a rule with no matching choice falls through to the next one.
+_CANNED_RESPONSE_RULES = (
+    (_keyword_re('etf', 'etfs', 'exchange traded fund', 'exchange traded funds'), (
+        (_keyword_re('best', 'top', 'recommend', 'good', 'popular'), _ETF_RECOMMENDATION_RESPONSE),
+        (None, _ETF_INFO_RESPONSE),
+    )),
+    (_keyword_re('strategy', 'strategies', 'how to invest', 'investment plan'), (
+        (_keyword_re('long term', 'long-term', 'retirement'), _LONG_TERM_STRATEGY_RESPONSE),
+        (_keyword_re('short term', 'short-term', 'day trading'), _SHORT_TERM_STRATEGY_RESPONSE),
+    )),
+    (_keyword_re('diversify', 'diversification', 'portfolio'), (
+        (None, _DIVERSIFICATION_RESPONSE),
+    )),
+    (_keyword_re('start investing', 'beginner', 'first time', 'how to start'), (
+        (None, _GETTING_STARTED_RESPONSE),
+    )),
+)
+
+class _SymbolOutlook(NamedTuple):
+    """Canned outlook wording used by the symbol prediction templates."""
+    trend: str
+    rsi: str
+    moving_average: str
+    volume: str
+    risk: str
+    signals: str
+    sentiment: str
+    movement: str
+    short_term: str
+    medium_term: str
+    key_factors: str
+
+_SYMBOL_OUTLOOKS = {
+    'AAPL': _SymbolOutlook('bullish', 'oversold', 'uptrend', 'stable', 'Medium', 'positive', 'neutral',
+                           'Upward', 'Bullish', 'Cautious', 'Strong fundamentals'),
+    'NVDA': _SymbolOutlook('bullish', 'oversold', 'uptrend', 'increasing', 'Medium', 'positive', 'bullish',
+                           'Upward', 'Bullish', 'Positive', 'Strong fundamentals'),
+    'TSLA': _SymbolOutlook('bullish', 'neutral', 'uptrend', 'increasing', 'High', 'positive', 'bullish',
+                           'Upward', 'Neutral', 'Positive', 'Market volatility'),
+}
+
+_DEFAULT_SYMBOL_OUTLOOK = _SymbolOutlook('mixed', 'neutral', 'sideways', 'stable', 'High', 'mixed', 'neutral',
+                                         'Sideways', 'Neutral', 'Cautious', 'Market volatility')
+
+# str.format templates for the symbol prediction responses
+_DAY_PREDICTION_TEMPLATE = (
+    "I'll analyze {symbol} for a specific day prediction. "
+    "Based on current technical indicators and market sentiment, here's my analysis:\n\n"
+    "**Technical Analysis for {symbol_upper}:**\n"
+    "• Current trend analysis shows {outlook.trend} momentum\n"
+    "• RSI indicates {outlook.rsi} conditions\n"
+    "• Moving averages suggest {outlook.moving_average} movement\n"
+    "• Volume analysis shows {outlook.volume} participation\n\n"
+    "**Prediction for {symbol_upper}:**\n"
+    "• Expected price range: ${predicted_range}\n"
+    "• Key support level: ${support}\n"
+    "• Key resistance level: ${resistance}\n"
+    "• Risk level: {outlook.risk}\n\n"
+    "**Note:** Due to current market data limitations, this analysis is based on historical patterns and technical indicators. "
+    "For real-time data, please try again in a few minutes.\n\n"
+    "Would you like me to run a detailed technical analysis or backtest for {symbol}?"
+)
+
+_PREDICTION_TEMPLATE = (
+    "Here's my prediction for {symbol_upper}:\n\n"
+    "**Current Analysis:**\n"
+    "• Technical indicators show {outlook.signals} signals\n"
+    "• Market sentiment is {outlook.sentiment}\n"
+    "• Expected movement: {outlook.movement} trend\n\n"
+    "**Prediction Summary:**\n"
+    "• Short-term (1-7 days): {outlook.short_term}\n"
+    "• Medium-term (1-4 weeks): {outlook.medium_term}\n"
+    "• Key factors: {outlook.key_factors}\n\n"
+    "Would you like a detailed technical analysis or risk assessment for {symbol}?"
+)
+
+# Canned responses used by ConversationalAgent._generate_financial_advisor_response
+_FINANCIAL_PLANNING_RESPONSE = (
+    "**📋 Comprehensive Financial Planning Services:**\n\n"
+    "I can help you create a complete financial plan including:\n\n"
+    "**1. Financial Profile Assessment**\n"
+    "• Age, income, and net worth analysis\n"
+    "• Risk tolerance evaluation\n"
+    "• Investment goals identification\n"
+    "• Time horizon planning\n\n"
+    "**2. Investment Strategy Development**\n"
+    "• Asset allocation recommendations\n"
+    "• Portfolio diversification\n"
+    "• Investment vehicle selection\n"
+    "• Risk management strategies\n\n"
+    "**3. Retirement Planning**\n"
+    "• Retirement savings calculations\n"
+    "• Social Security optimization\n"
+    "• Required monthly savings\n"
+    "• Retirement account strategies\n\n"
+    "**4. Tax & Estate Planning**\n"
+    "• Tax-efficient investment strategies\n"
+    "• Retirement account optimization\n"
+    "• Estate planning considerations\n\n"
+    "**5. Insurance & Risk Management**\n"
+    "• Life insurance needs analysis\n"
+    "• Disability insurance recommendations\n"
+    "• Emergency fund planning\n\n"
+    "To get started, please provide:\n"
+    "• Your age and income\n"
+    "• Current net worth and savings\n"
+    "• Risk tolerance (conservative/moderate/aggressive)\n"
+    "• Investment goals and time horizon\n\n"
+    "Would you like to create your financial profile now?"
+)
+
+_RETIREMENT_PLANNING_RESPONSE = (
+    "**🏖️ Retirement Planning Services:**\n\n"
+    "I can help you plan for a secure retirement with:\n\n"
+    "**1. Retirement Needs Analysis**\n"
+    "• Calculate required retirement savings\n"
+    "• Estimate retirement expenses\n"
+    "• Social Security benefit analysis\n"
+    "• Retirement income gap identification\n\n"
+    "**2. Savings Strategy**\n"
+    "• Monthly savings requirements\n"
+    "• 401(k) and IRA optimization\n"
+    "• Catch-up contribution strategies\n"
+    "• Investment allocation for retirement\n\n"
+    "**3. Retirement Account Management**\n"
+    "• Traditional vs Roth IRA decisions\n"
+    "• 401(k) rollover strategies\n"
+    "• Required Minimum Distribution (RMD) planning\n"
+    "• Tax-efficient withdrawal strategies\n\n"
+    "**4. Retirement Timeline Planning**\n"
+    "• Years to retirement calculation\n"
+    "• Retirement readiness assessment\n"
+    "• Working longer considerations\n"
+    "• Early retirement planning\n\n"
+    "To get your personalized retirement plan, please provide:\n"
+    "• Your current age and retirement age goal\n"
+    "• Current income and savings\n"
+    "• Expected retirement lifestyle\n"
+    "• Current retirement account balances\n\n"
+    "Would you like to start your retirement planning analysis?"
+)
+
+_RISK_ASSESSMENT_RESPONSE = (
+    "**⚠️ Risk Assessment & Tolerance Analysis:**\n\n"
+    "I can help you understand and manage investment risk:\n\n"
+    "**1. Risk Tolerance Evaluation**\n"
+    "• Conservative: 20-40% stocks, 60-80% bonds\n"
+    "• Moderate: 40-70% stocks, 30-60% bonds\n"
+    "• Aggressive: 70-90% stocks, 10-30% bonds\n\n"
+    "**2. Portfolio Risk Analysis**\n"
+    "• Volatility assessment\n"
+    "• Maximum drawdown potential\n"
+    "• Sharpe ratio calculation\n"
+    "• Value at Risk (VaR) analysis\n\n"
+    "**3. Risk Management Strategies**\n"
+    "• Asset allocation optimization\n"
+    "• Diversification recommendations\n"
+    "• Stop-loss strategies\n"
+    "• Position sizing guidelines\n\n"
+    "**4. Stress Testing**\n"
+    "• Market crash scenarios\n"
+    "• Inflation impact analysis\n"
+    "• Interest rate sensitivity\n"
+    "• Economic downturn preparation\n\n"
+    "To assess your risk profile, please provide:\n"
+    "• Your age and investment experience\n"
+    "• Financial goals and time horizon\n"
+    "• Comfort level with market volatility\n"
+    "• Current investment portfolio\n\n"
+    "Would you like to take a risk assessment quiz?"
+)
+
+_ADVISOR_HELP_RESPONSE = (
+    "I'm your comprehensive financial advisor! I can help you with:\n\n"
+    "**📊 Investment Planning**\n"
+    "• Portfolio analysis and recommendations\n"
+    "• Asset allocation strategies\n"
+    "• Risk assessment and management\n\n"
+    "**💰 Financial Planning**\n"
+    "• Retirement planning and savings\n"
+    "• Tax-efficient strategies\n"
+    "• Debt management\n"
+    "• Emergency fund planning\n\n"
+    "**🎯 Personalized Advice**\n"
+    "• Financial profile creation\n"
+    "• Goal-based planning\n"
+    "• Investment recommendations\n\n"
+    "What specific financial planning area would you like to focus on?"
+)
+
+# Static lookup tables used by the ConversationalAgent plan and prediction helpers
+_ASSET_ALLOCATIONS_BY_RISK = {
+    'conservative': "• Bonds: 60%\n• Large-cap stocks: 25%\n• International stocks: 10%\n• Cash: 5%",
+    'moderate': "• Bonds: 40%\n• Large-cap stocks: 35%\n• Mid-cap stocks: 15%\n• International stocks: 10%",
+    'aggressive': "• Bonds: 20%\n• Large-cap stocks: 40%\n• Mid-cap stocks: 20%\n• Small-cap stocks: 10%\n• International stocks: 10%"
+}
+
+_INVESTMENT_RECOMMENDATIONS_BY_RISK = {
+    'conservative': "• VOO (S&P 500 ETF)\n• BND (Total Bond Market)\n• VXUS (International Stocks)",
+    'moderate': "• VTI (Total Stock Market)\n• BND (Total Bond Market)\n• VXUS (International Stocks)\n• QQQ (Technology)",
+    'aggressive': "• VTI (Total Stock Market)\n• QQQ (Technology)\n• VXUS (International Stocks)\n• VB (Small-cap stocks)"
+}
+
+_PREDICTED_RANGES = {
+    'AAPL': '150-170',
+    'NVDA': '450-550',
+    'TSLA': '200-250',
+    'MSFT': '350-400',
+    'GOOGL': '130-150'
+}
+
+_SUPPORT_LEVELS = {
+    'AAPL': '155',
+    'NVDA': '480',
+    'TSLA': '220',
+    'MSFT': '360',
+    'GOOGL': '135'
+}
+
+_RESISTANCE_LEVELS = {
+    'AAPL': '165',
+    'NVDA': '520',
+    'TSLA': '240',
+    'MSFT': '380',
+    'GOOGL': '145'
+}
+
+# Topic routing for _generate_financial_advisor_response, checked in priority order
+_ADVISOR_TOPIC_RULES = (
+    (_keyword_re('financial plan', 'financial planning'), _FINANCIAL_PLANNING_RESPONSE),
+    (_keyword_re('retirement', 'retire'), _RETIREMENT_PLANNING_RESPONSE),
+    (_keyword_re('risk assessment', 'risk tolerance'), _RISK_ASSESSMENT_RESPONSE),
+)
+
+# Fallback plan rendered by ConversationalAgent._generate_basic_financial_plan
+_BASIC_PLAN_DEFAULTS = {
+    'age': 35,
+    'income': 75000,
+    'net_worth': 100000,
+    'risk_tolerance': 'moderate'
+}
+
+_RISK_TITLES = {
+    'conservative': 'Conservative',
+    'moderate': 'Moderate',
+    'aggressive': 'Aggressive'
+}
+
+_BASIC_PLAN_TEMPLATE = """**📋 Personalized Financial Plan**
+
+**Client Profile:**
+• Age: {age}
+• Income: ${income:,.0f}
+• Net Worth: ${net_worth:,.0f}
+• Risk Tolerance: {risk_title}
+
+**Asset Allocation Recommendation:**
+{asset_allocation}
+
+**Investment Recommendations:**
+{investment_recommendations}
+
+**Next Steps:**
+1. Review and approve this plan
+2. Set up automatic contributions
+3. Schedule quarterly reviews
+4. Monitor progress and adjust as needed
+
+Would you like me to create a more detailed financial plan with specific investment recommendations?"""
+
+_financial_advisor = None
+
+def _get_financial_advisor():
+    """Return the shared FinancialAdvisor, importing and creating it on first use."""
+    global _financial_advisor
+    if _financial_advisor is None:
+        from financial_advisor import FinancialAdvisor
+        _financial_advisor = FinancialAdvisor()
+    return _financial_advisor
 
 class ConversationalAgent:
     """Conversational AI agent for stock analysis."""
     
-    def __init__(self):
-        # Initialize conversation history
-        self.conversation_history = []
+    def __init__(self, max_history: int = 200):
+        # Initialize conversation history (bounded so long sessions don't pin every intent)
+        self.conversation_history = deque(maxlen=max_history)
         
         # Initialize NLP components
         self.nlp_processor = NLPProcessor()
         self.sentiment_analyzer = SentimentAnalyzer()
         
-        # Enhanced patterns for financial advisory
-        self.financial_advisor_patterns = [
+        # Enhanced patterns for financial advisory (compiled once per agent)
+        self.financial_advisor_patterns = [re.compile(pattern) for pattern in [
             r'\b(create|generate|make)\s+(a\s+)?(financial\s+)?(plan|profile|strategy)\b',
             r'\b(retirement|retire)\s+(plan|planning|strategy|savings)\b',
             r'\b(risk\s+)?(assessment|tolerance|profile)\b',
@@ -490,17 +971,22 @@ class ConversationalAgent:
             r'\b(net\s+worth|assets)\s+(\d+[kKmM]?)\b',
             r'\b(conservative|moderate|aggressive)\s+(investor|investment|strategy)\b',
             r'\b(short|medium|long)\s+term\s+(investment|goal|planning)\b'
-        ]
+        ]]
+        # All advisor patterns fused into one alternation so detection is a single search
+        self._financial_advisor_re = re.compile(
+            '|'.join(f'(?:{pattern.pattern})' for pattern in self.financial_advisor_patterns)
+        )
         
-        # Financial profile extraction patterns
-        self.profile_patterns = {
-            'age': r'\b(\d+)\s*(years?\s+old|age|yo)\b',
-            'income': r'\b(income|salary|earn)\s*(?:of\s*)?\$?(\d+(?:,\d{3})*(?:\.\d{2})?[kKmM]?)\b',
-            'net_worth': r'\b(net\s+worth|assets|savings)\s*(?:of\s*)?\$?(\d+(?:,\d{3})*(?:\.\d{2})?[kKmM]?)\b',
-            'risk_tolerance': r'\b(conservative|moderate|aggressive)\b',
-            'goals': r'\b(retirement|education|home\s+purchase|wealth\s+building|income\s+generation|tax\s+efficiency)\b',
-            'time_horizon': r'\b(short\s+term|medium\s+term|long\s+term)\b'
-        }
+        # Financial profile extraction patterns (compiled once per agent). Each pattern
+        # captures its value in a group named after its key.
+        self.profile_patterns = {key: re.compile(pattern) for key, pattern in {
+            'age': r'\b(?P<age>\d+)\s*(?:years?\s+old|age|yo)\b',
+            'income': r'\b(?:income|salary|earn)\s*(?:of\s*)?\$?(?P<income>\d+(?:,\d{3})*(?:\.\d{2})?[kKmM]?)\b',
+            'net_worth': r'\b(?:net\s+worth|assets|savings)\s*(?:of\s*)?\$?(?P<net_worth>\d+(?:,\d{3})*(?:\.\d{2})?[kKmM]?)\b',
+            'risk_tolerance': r'\b(?P<risk_tolerance>conservative|moderate|aggressive)\b',
+            'goals': r'\b(?P<goals>retirement|education|home\s+purchase|wealth\s+building|income\s+generation|tax\s+efficiency)\b',
+            'time_horizon': r'\b(?P<time_horizon>short\s+term|medium\s+term|long\s+term)\b'
+        }.items()}
         
         # Enhanced prediction patterns
         self.prediction_patterns = [
@@ -559,223 +1045,69 @@ class ConversationalAgent:
     
     def _generate_response(self, intent: QueryIntent, context: Dict = None) -> str:
         """Generate response based on query intent and context"""
-        query_lower = intent.raw_query.lower()
-        
+        query_lower = intent.lower_query or intent.raw_query.lower()
+        symbol = intent.symbols[0] if intent.symbols else None
+        return self._render_response(query_lower, intent.query_type, symbol)
+
+    def _render_response(self, query_lower: str, query_type: QueryType, symbol: Optional[str]) -> str:
+        """Render the response for a lowercased query, its type and leading symbol"""
         # Financial Advisory Queries
         if self._is_financial_advisor_query(query_lower):
-            return self._generate_financial_advisor_response(intent, context)
+            return self._render_financial_advisor_response(query_lower)
         
-        # ETF Recommendations
-        if any(word in query_lower for word in ['etf', 'etfs', 'exchange traded fund', 'exchange traded funds']):
-            if any(word in query_lower for word in ['best', 'top', 'recommend', 'good', 'popular']):
-                return ("Here are some of the best ETFs to consider for different investment strategies:\n\n"
-                       "**📈 Broad Market ETFs (Core Holdings):**\n"
-                       "• **SPY** - SPDR S&P 500 ETF (Large-cap US stocks)\n"
-                       "• **VOO** - Vanguard S&P 500 ETF (Lower expense ratio)\n"
-                       "• **VTI** - Vanguard Total Stock Market ETF (Complete US market)\n"
-                       "• **QQQ** - Invesco QQQ Trust (Technology-heavy)\n\n"
-                       "**🌍 International ETFs (Diversification):**\n"
-                       "• **VXUS** - Vanguard Total International Stock ETF\n"
-                       "• **EFA** - iShares MSCI EAFE ETF (Developed markets)\n"
-                       "• **EEM** - iShares MSCI Emerging Markets ETF\n\n"
-                       "**💰 Bond ETFs (Income & Stability):**\n"
-                       "• **BND** - Vanguard Total Bond Market ETF\n"
-                       "• **AGG** - iShares Core U.S. Aggregate Bond ETF\n"
-                       "• **TLT** - iShares 20+ Year Treasury Bond ETF\n\n"
-                       "**🏠 Sector ETFs (Targeted Exposure):**\n"
-                       "• **XLK** - Technology Select Sector SPDR Fund\n"
-                       "• **XLF** - Financial Select Sector SPDR Fund\n"
-                       "• **XLE** - Energy Select Sector SPDR Fund\n"
-                       "• **VNQ** - Vanguard Real Estate ETF\n\n"
-                       "**💡 Recommended Strategy:**\n"
-                       "• **Conservative:** 60% BND + 25% VOO + 15% VXUS\n"
-                       "• **Moderate:** 40% VOO + 20% VXUS + 25% BND + 15% QQQ\n"
-                       "• **Aggressive:** 50% VOO + 20% QQQ + 15% VXUS + 15% sector ETFs\n\n"
-                       "Would you like me to create a personalized ETF portfolio based on your financial profile?")
-            else:
-                return ("ETFs (Exchange-Traded Funds) are investment funds that trade on stock exchanges like individual stocks. They offer:\n\n"
-                       "**✅ Advantages:**\n"
-                       "• Diversification across many stocks/bonds\n"
-                       "• Lower expense ratios than mutual funds\n"
-                       "• Tax efficiency\n"
-                       "• Easy to buy/sell\n"
-                       "• Transparent holdings\n\n"
-                       "**📊 Popular Categories:**\n"
-                       "• **Index ETFs:** Track market indices (SPY, VOO)\n"
-                       "• **Sector ETFs:** Focus on specific sectors (XLK, XLF)\n"
-                       "• **International ETFs:** Global diversification (VXUS, EFA)\n"
-                       "• **Bond ETFs:** Fixed income exposure (BND, AGG)\n\n"
-                       "Would you like me to recommend specific ETFs based on your investment goals and risk tolerance?")
-
-        # Investment Strategy Queries
-        if any(word in query_lower for word in ['strategy', 'strategies', 'how to invest', 'investment plan']):
-            if any(word in query_lower for word in ['long term', 'long-term', 'retirement']):
-                return ("**📈 Long-Term Investment Strategy (10+ years):**\n\n"
-                       "**1. Asset Allocation by Age:**\n"
-                       "• **20s-30s:** 80-90% stocks, 10-20% bonds\n"
-                       "• **40s-50s:** 60-80% stocks, 20-40% bonds\n"
-                       "• **60s+:** 40-60% stocks, 40-60% bonds\n\n"
-                       "**2. Core Holdings:**\n"
-                       "• **VTI** - Total US Stock Market (40-50%)\n"
-                       "• **VXUS** - Total International Stocks (20-30%)\n"
-                       "• **BND** - Total Bond Market (20-30%)\n\n"
-                       "**3. Dollar-Cost Averaging:**\n"
-                       "• Invest regularly (monthly/quarterly)\n"
-                       "• Reduces timing risk\n"
-                       "• Automates the process\n\n"
-                       "**4. Tax-Efficient Accounts:**\n"
-                       "• Max out 401(k) and IRA contributions\n"
-                       "• Use Roth accounts for tax-free growth\n"
-                       "• Consider HSA for healthcare expenses\n\n"
-                       "**5. Rebalancing:**\n"
-                       "• Review annually\n"
-                       "• Rebalance when allocations drift >5%\n"
-                       "• Maintain target risk level\n\n"
-                       "Would you like me to create a personalized long-term investment plan?")
-            elif any(word in query_lower for word in ['short term', 'short-term', 'day trading']):
-                return ("**⚡ Short-Term Trading Strategy (Days to Months):**\n\n"
-                       "**⚠️ Important:** Short-term trading is high-risk and requires significant time and knowledge.\n\n"
-                       "**1. High-Liquidity Stocks:**\n"
-                       "• **SPY** - S&P 500 ETF (High volume)\n"
-                       "• **QQQ** - Nasdaq ETF (Tech focus)\n"
-                       "• **AAPL, MSFT, GOOGL** - Large-cap tech\n"
-                       "• **TSLA, NVDA** - High volatility\n\n"
-                       "**2. Technical Analysis:**\n"
-                       "• Moving averages (20, 50, 200-day)\n"
-                       "• RSI for overbought/oversold\n"
-                       "• MACD for momentum\n"
-                       "• Support/resistance levels\n\n"
-                       "**3. Risk Management:**\n"
-                       "• Set stop-loss orders (2-3% max loss)\n"
-                       "• Never risk more than 1-2% per trade\n"
-                       "• Use position sizing\n"
-                       "• Have an exit strategy\n\n"
-                       "**4. Market Timing:**\n"
-                       "• Trade during market hours (9:30 AM - 4:00 PM ET)\n"
-                       "• Avoid earnings announcements\n"
-                       "• Watch for market catalysts\n\n"
-                       "**💡 Recommendation:** Consider long-term investing instead, as it's more reliable and less stressful.")
-
-        # Portfolio Diversification
-        if any(word in query_lower for word in ['diversify', 'diversification', 'portfolio']):
-            return ("**🌍 Portfolio Diversification Strategy:**\n\n"
-                   "**1. Asset Class Diversification:**\n"
-                   "• **Stocks:** 60-80% (Growth potential)\n"
-                   "• **Bonds:** 20-40% (Stability & income)\n"
-                   "• **Real Estate:** 5-15% (Inflation hedge)\n"
-                   "• **Commodities:** 0-10% (Diversification)\n\n"
-                   "**2. Geographic Diversification:**\n"
-                   "• **US Stocks:** 50-70% (Home bias)\n"
-                   "• **International Developed:** 20-30% (Europe, Japan)\n"
-                   "• **Emerging Markets:** 5-15% (Growth potential)\n\n"
-                   "**3. Sector Diversification:**\n"
-                   "• **Technology:** 15-25%\n"
-                   "• **Healthcare:** 10-15%\n"
-                   "• **Financial:** 10-15%\n"
-                   "• **Consumer:** 10-15%\n"
-                   "• **Other sectors:** 35-55%\n\n"
-                   "**4. Company Size Diversification:**\n"
-                   "• **Large-cap:** 40-60% (Stability)\n"
-                   "• **Mid-cap:** 20-30% (Growth)\n"
-                   "• **Small-cap:** 10-20% (High growth potential)\n\n"
-                   "**5. Investment Vehicles:**\n"
-                   "• **ETFs:** Easy diversification\n"
-                   "• **Index funds:** Low-cost broad exposure\n"
-                   "• **Individual stocks:** Targeted positions\n"
-                   "• **Bonds:** Government and corporate\n\n"
-                   "Would you like me to analyze your current portfolio and suggest diversification improvements?")
-
-        # Getting Started with Investing
-        if any(word in query_lower for word in ['start investing', 'beginner', 'first time', 'how to start']):
-            return ("**🚀 Getting Started with Investing:**\n\n"
-                   "**Step 1: Build Emergency Fund**\n"
-                   "• Save 3-6 months of expenses\n"
-                   "• Keep in high-yield savings account\n"
-                   "• Don't invest until this is complete\n\n"
-                   "**Step 2: Pay Off High-Interest Debt**\n"
-                   "• Credit cards (15-25% interest)\n"
-                   "• Personal loans\n"
-                   "• Student loans (if >6%)\n\n"
-                   "**Step 3: Choose Investment Account**\n"
-                   "• **401(k):** Employer-sponsored (tax-advantaged)\n"
-                   "• **IRA:** Individual retirement account\n"
-                   "• **Roth IRA:** Tax-free growth (if eligible)\n"
-                   "• **Taxable account:** For additional investments\n\n"
-                   "**Step 4: Start with Index Funds**\n"
-                   "• **VTI** - Total US Stock Market\n"
-                   "• **VOO** - S&P 500 Index\n"
-                   "• **BND** - Total Bond Market\n\n"
-                   "**Step 5: Dollar-Cost Averaging**\n"
-                   "• Invest regularly (monthly)\n"
-                   "• Start with $100-500/month\n"
-                   "• Increase as you earn more\n\n"
-                   "**Step 6: Set Investment Goals**\n"
-                   "• Retirement (long-term)\n"
-                   "• House down payment (medium-term)\n"
-                   "• Emergency fund (short-term)\n\n"
-                   "**💡 Beginner Portfolio:**\n"
-                   "• 70% VTI (US stocks)\n"
-                   "• 20% VXUS (International stocks)\n"
-                   "• 10% BND (Bonds)\n\n"
-                   "Would you like me to help you create a personalized investment plan?")
+        # Keyword-routed canned responses (ETFs, strategies, diversification, getting started)
+        canned_response = self._match_canned_response(query_lower)
+        if canned_response is not None:
+            return canned_response
 
         # Prediction Queries
-        if intent.query_type == QueryType.PREDICTION:
-            if intent.symbols:
-                symbol = intent.symbols[0]
-                time_period = intent.time_period or '1d'
-                if any(day in query_lower for day in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']):
-                    return (f"I'll analyze {symbol} for a specific day prediction. "
-                           f"Based on current technical indicators and market sentiment, here's my analysis:\n\n"
-                           f"**Technical Analysis for {symbol.upper()}:**\n"
-                           f"• Current trend analysis shows {'bullish' if symbol in ['AAPL', 'NVDA', 'TSLA'] else 'mixed'} momentum\n"
-                           f"• RSI indicates {'oversold' if symbol in ['AAPL', 'NVDA'] else 'neutral'} conditions\n"
-                           f"• Moving averages suggest {'uptrend' if symbol in ['AAPL', 'NVDA', 'TSLA'] else 'sideways'} movement\n"
-                           f"• Volume analysis shows {'increasing' if symbol in ['NVDA', 'TSLA'] else 'stable'} participation\n\n"
-                           f"**Prediction for {symbol.upper()}:**\n"
-                           f"• Expected price range: ${self._get_predicted_range(symbol)}\n"
-                           f"• Key support level: ${self._get_support_level(symbol)}\n"
-                           f"• Key resistance level: ${self._get_resistance_level(symbol)}\n"
-                           f"• Risk level: {'Medium' if symbol in ['AAPL', 'NVDA'] else 'High'}\n\n"
-                           f"**Note:** Due to current market data limitations, this analysis is based on historical patterns and technical indicators. "
-                           f"For real-time data, please try again in a few minutes.\n\n"
-                           f"Would you like me to run a detailed technical analysis or backtest for {symbol}?")
-                else:
-                    return (f"Here's my prediction for {symbol.upper()}:\n\n"
-                           f"**Current Analysis:**\n"
-                           f"• Technical indicators show {'positive' if symbol in ['AAPL', 'NVDA', 'TSLA'] else 'mixed'} signals\n"
-                           f"• Market sentiment is {'bullish' if symbol in ['NVDA', 'TSLA'] else 'neutral'}\n"
-                           f"• Expected movement: {'Upward' if symbol in ['AAPL', 'NVDA', 'TSLA'] else 'Sideways'} trend\n\n"
-                           f"**Prediction Summary:**\n"
-                           f"• Short-term (1-7 days): {'Bullish' if symbol in ['AAPL', 'NVDA'] else 'Neutral'}\n"
-                           f"• Medium-term (1-4 weeks): {'Positive' if symbol in ['NVDA', 'TSLA'] else 'Cautious'}\n"
-                           f"• Key factors: {'Strong fundamentals' if symbol in ['AAPL', 'NVDA'] else 'Market volatility'}\n\n"
-                           f"Would you like a detailed technical analysis or risk assessment for {symbol}?")
+        if query_type == QueryType.PREDICTION and symbol:
+            return self._render_prediction_response(query_lower, symbol)
 
         # Default response
-        return ("I can help you with comprehensive financial planning and investment analysis. Here are some things I can assist with:\n\n"
-               "**📊 Investment Analysis:**\n"
-               "• Stock predictions and technical analysis\n"
-               "• ETF recommendations and portfolio building\n"
-               "• Risk assessment and diversification\n\n"
-               "**💰 Financial Planning:**\n"
-               "• Retirement planning and savings strategies\n"
-               "• Tax-efficient investment strategies\n"
-               "• Debt management and emergency fund planning\n\n"
-               "**🎯 Personalized Advice:**\n"
-               "• Create financial profiles and plans\n"
-               "• Asset allocation recommendations\n"
-               "• Investment goal setting\n\n"
-               "What would you like to focus on today?")
+        return _DEFAULT_HELP_RESPONSE
+
+    def _render_prediction_response(self, query_lower: str, symbol: str) -> str:
+        """Render the prediction response for a symbol, day-specific when a weekday is mentioned"""
+        outlook = _SYMBOL_OUTLOOKS.get(symbol, _DEFAULT_SYMBOL_OUTLOOK)
+        if _WEEKDAY_RE.search(query_lower):
+            return _DAY_PREDICTION_TEMPLATE.format(
+                symbol=symbol,
+                symbol_upper=symbol.upper(),
+                outlook=outlook,
+                predicted_range=self._get_predicted_range(symbol),
+                support=self._get_support_level(symbol),
+                resistance=self._get_resistance_level(symbol)
+            )
+        return _PREDICTION_TEMPLATE.format(
+            symbol=symbol,
+            symbol_upper=symbol.upper(),
+            outlook=outlook
+        )
+
+    def _match_canned_response(self, query: str) -> Optional[str]:
+        """Return the canned response routed by keywords in the query, if any"""
+        for trigger, choices in _CANNED_RESPONSE_RULES:
+            if trigger.search(query):
+                for qualifier, response in choices:
+                    if qualifier is None or qualifier.search(query):
+                        return response
+        return None
 
     def _is_financial_advisor_query(self, query: str) -> bool:
         """Check if query is related to financial advisory services"""
-        return any(re.search(pattern, query) for pattern in self.financial_advisor_patterns)
+        # Every advisor pattern contains at least one of these stems, so most
+        # non-advisory queries are rejected by a cheap literal scan
+        if not _ADVISOR_PREFILTER_RE.search(query):
+            return False
+        return self._financial_advisor_re.search(query) is not None
 
     def _generate_financial_advisor_response(self, intent: QueryIntent, context: Dict = None) -> str:
         """Generate comprehensive financial advisory response"""
-        query_lower = intent.raw_query.lower()
-        
+        return self._render_financial_advisor_response(intent.lower_query or intent.raw_query.lower())
+
+    def _render_financial_advisor_response(self, query_lower: str) -> str:
+        """Render the financial advisory response for a lowercased query"""
         # Extract financial profile information
         profile_data = self._extract_financial_profile(query_lower)
         
@@ -783,162 +1115,50 @@ class ConversationalAgent:
             return self._generate_personalized_financial_plan(profile_data)
         
         # General financial advisory responses
-        if any(word in query_lower for word in ['financial plan', 'financial planning']):
-            return ("**📋 Comprehensive Financial Planning Services:**\n\n"
-                   "I can help you create a complete financial plan including:\n\n"
-                   "**1. Financial Profile Assessment**\n"
-                   "• Age, income, and net worth analysis\n"
-                   "• Risk tolerance evaluation\n"
-                   "• Investment goals identification\n"
-                   "• Time horizon planning\n\n"
-                   "**2. Investment Strategy Development**\n"
-                   "• Asset allocation recommendations\n"
-                   "• Portfolio diversification\n"
-                   "• Investment vehicle selection\n"
-                   "• Risk management strategies\n\n"
-                   "**3. Retirement Planning**\n"
-                   "• Retirement savings calculations\n"
-                   "• Social Security optimization\n"
-                   "• Required monthly savings\n"
-                   "• Retirement account strategies\n\n"
-                   "**4. Tax & Estate Planning**\n"
-                   "• Tax-efficient investment strategies\n"
-                   "• Retirement account optimization\n"
-                   "• Estate planning considerations\n\n"
-                   "**5. Insurance & Risk Management**\n"
-                   "• Life insurance needs analysis\n"
-                   "• Disability insurance recommendations\n"
-                   "• Emergency fund planning\n\n"
-                   "To get started, please provide:\n"
-                   "• Your age and income\n"
-                   "• Current net worth and savings\n"
-                   "• Risk tolerance (conservative/moderate/aggressive)\n"
-                   "• Investment goals and time horizon\n\n"
-                   "Would you like to create your financial profile now?")
-
-        elif any(word in query_lower for word in ['retirement', 'retire']):
-            return ("**🏖️ Retirement Planning Services:**\n\n"
-                   "I can help you plan for a secure retirement with:\n\n"
-                   "**1. Retirement Needs Analysis**\n"
-                   "• Calculate required retirement savings\n"
-                   "• Estimate retirement expenses\n"
-                   "• Social Security benefit analysis\n"
-                   "• Retirement income gap identification\n\n"
-                   "**2. Savings Strategy**\n"
-                   "• Monthly savings requirements\n"
-                   "• 401(k) and IRA optimization\n"
-                   "• Catch-up contribution strategies\n"
-                   "• Investment allocation for retirement\n\n"
-                   "**3. Retirement Account Management**\n"
-                   "• Traditional vs Roth IRA decisions\n"
-                   "• 401(k) rollover strategies\n"
-                   "• Required Minimum Distribution (RMD) planning\n"
-                   "• Tax-efficient withdrawal strategies\n\n"
-                   "**4. Retirement Timeline Planning**\n"
-                   "• Years to retirement calculation\n"
-                   "• Retirement readiness assessment\n"
-                   "• Working longer considerations\n"
-                   "• Early retirement planning\n\n"
-                   "To get your personalized retirement plan, please provide:\n"
-                   "• Your current age and retirement age goal\n"
-                   "• Current income and savings\n"
-                   "• Expected retirement lifestyle\n"
-                   "• Current retirement account balances\n\n"
-                   "Would you like to start your retirement planning analysis?")
-
-        elif any(word in query_lower for word in ['risk assessment', 'risk tolerance']):
-            return ("**⚠️ Risk Assessment & Tolerance Analysis:**\n\n"
-                   "I can help you understand and manage investment risk:\n\n"
-                   "**1. Risk Tolerance Evaluation**\n"
-                   "• Conservative: 20-40% stocks, 60-80% bonds\n"
-                   "• Moderate: 40-70% stocks, 30-60% bonds\n"
-                   "• Aggressive: 70-90% stocks, 10-30% bonds\n\n"
-                   "**2. Portfolio Risk Analysis**\n"
-                   "• Volatility assessment\n"
-                   "• Maximum drawdown potential\n"
-                   "• Sharpe ratio calculation\n"
-                   "• Value at Risk (VaR) analysis\n\n"
-                   "**3. Risk Management Strategies**\n"
-                   "• Asset allocation optimization\n"
-                   "• Diversification recommendations\n"
-                   "• Stop-loss strategies\n"
-                   "• Position sizing guidelines\n\n"
-                   "**4. Stress Testing**\n"
-                   "• Market crash scenarios\n"
-                   "• Inflation impact analysis\n"
-                   "• Interest rate sensitivity\n"
-                   "• Economic downturn preparation\n\n"
-                   "To assess your risk profile, please provide:\n"
-                   "• Your age and investment experience\n"
-                   "• Financial goals and time horizon\n"
-                   "• Comfort level with market volatility\n"
-                   "• Current investment portfolio\n\n"
-                   "Would you like to take a risk assessment quiz?")
+        for topic, response in _ADVISOR_TOPIC_RULES:
+            if topic.search(query_lower):
+                return response
 
-        else:
-            return ("I'm your comprehensive financial advisor! I can help you with:\n\n"
-                   "**📊 Investment Planning**\n"
-                   "• Portfolio analysis and recommendations\n"
-                   "• Asset allocation strategies\n"
-                   "• Risk assessment and management\n\n"
-                   "**💰 Financial Planning**\n"
-                   "• Retirement planning and savings\n"
-                   "• Tax-efficient strategies\n"
-                   "• Debt management\n"
-                   "• Emergency fund planning\n\n"
-                   "**🎯 Personalized Advice**\n"
-                   "• Financial profile creation\n"
-                   "• Goal-based planning\n"
-                   "• Investment recommendations\n\n"
-                   "What specific financial planning area would you like to focus on?")
+        return _ADVISOR_HELP_RESPONSE
 
     def _extract_financial_profile(self, query: str) -> Dict:
         """Extract financial profile information from query"""
         profile = {}
+        patterns = self.profile_patterns
         
-        # Extract age
-        age_match = re.search(self.profile_patterns['age'], query)
+        # Each field is searched on its own, so one number can feed two fields
+        # (e.g. "savings 30 yo" gives both net worth and age)
+        age_match = patterns['age'].search(query)
         if age_match:
-            profile['age'] = int(age_match.group(1))
-        
-        # Extract income
-        income_match = re.search(self.profile_patterns['income'], query)
-        if income_match:
-            income_str = income_match.group(2)
-            profile['income'] = self._parse_money_amount(income_str)
+            profile['age'] = int(age_match.group('age'))
         
-        # Extract net worth
-        net_worth_match = re.search(self.profile_patterns['net_worth'], query)
-        if net_worth_match:
-            net_worth_str = net_worth_match.group(2)
-            profile['net_worth'] = self._parse_money_amount(net_worth_str)
+        for field in ('income', 'net_worth'):
+            money_match = patterns[field].search(query)
+            if money_match:
+                profile[field] = self._parse_money_amount(money_match.group(field))
         
-        # Extract risk tolerance
-        risk_match = re.search(self.profile_patterns['risk_tolerance'], query)
+        risk_match = patterns['risk_tolerance'].search(query)
         if risk_match:
-            profile['risk_tolerance'] = risk_match.group(1)
+            profile['risk_tolerance'] = risk_match.group('risk_tolerance')
         
-        # Extract goals
-        goals = re.findall(self.profile_patterns['goals'], query)
+        goals = patterns['goals'].findall(query)
         if goals:
             profile['goals'] = goals
         
-        # Extract time horizon
-        time_match = re.search(self.profile_patterns['time_horizon'], query)
+        time_match = patterns['time_horizon'].search(query)
         if time_match:
-            profile['time_horizon'] = time_match.group(1)
+            profile['time_horizon'] = time_match.group('time_horizon')
         
         return profile
 
     def _parse_money_amount(self, amount_str: str) -> float:
         """Parse money amounts with K, M suffixes"""
-        amount_str = amount_str.replace(',', '').upper()
-        if 'K' in amount_str:
-            return float(amount_str.replace('K', '')) * 1000
-        elif 'M' in amount_str:
-            return float(amount_str.replace('M', '')) * 1000000
-        else:
-            return float(amount_str)
+        amount_str = amount_str.translate(_MONEY_TABLE)
+        if amount_str.endswith('K'):
+            return float(amount_str[:-1]) * 1000
+        if amount_str.endswith('M'):
+            return float(amount_str[:-1]) * 1000000
+        return float(amount_str)
 
     def _generate_personalized_financial_plan(self, profile_data: Dict) -> str:
         """Generate personalized financial plan based on profile data"""
@@ -953,8 +1173,7 @@ class ConversationalAgent:
         
         # Generate plan using financial advisor
         try:
-            from financial_advisor import FinancialAdvisor
-            advisor = FinancialAdvisor()
+            advisor = _get_financial_advisor()
             
             client_profile = advisor.create_client_profile(
                 age=age,
@@ -974,80 +1193,29 @@ class ConversationalAgent:
 
     def _generate_basic_financial_plan(self, profile_data: Dict) -> str:
         """Generate basic financial plan when advisor is not available"""
-        age = profile_data.get('age', 35)
-        income = profile_data.get('income', 75000)
-        net_worth = profile_data.get('net_worth', 100000)
-        risk_tolerance = profile_data.get('risk_tolerance', 'moderate')
-        
-        return f"""**📋 Personalized Financial Plan**
-
-**Client Profile:**
-• Age: {age}
-• Income: ${income:,.0f}
-• Net Worth: ${net_worth:,.0f}
-• Risk Tolerance: {risk_tolerance.title()}
-
-**Asset Allocation Recommendation:**
-{self._get_asset_allocation_by_risk(risk_tolerance)}
-
-**Investment Recommendations:**
-{self._get_investment_recommendations_by_risk(risk_tolerance)}
-
-**Next Steps:**
-1. Review and approve this plan
-2. Set up automatic contributions
-3. Schedule quarterly reviews
-4. Monitor progress and adjust as needed
-
-Would you like me to create a more detailed financial plan with specific investment recommendations?"""
+        plan = {**_BASIC_PLAN_DEFAULTS, **profile_data}
+        risk_tolerance = plan['risk_tolerance']
+        plan['risk_title'] = _RISK_TITLES.get(risk_tolerance) or risk_tolerance.title()
+        plan['asset_allocation'] = self._get_asset_allocation_by_risk(risk_tolerance)
+        plan['investment_recommendations'] = self._get_investment_recommendations_by_risk(risk_tolerance)
+        return _BASIC_PLAN_TEMPLATE.format_map(plan)
 
     def _get_asset_allocation_by_risk(self, risk_tolerance: str) -> str:
         """Get asset allocation recommendation by risk tolerance"""
-        allocations = {
-            'conservative': "• Bonds: 60%\n• Large-cap stocks: 25%\n• International stocks: 10%\n• Cash: 5%",
-            'moderate': "• Bonds: 40%\n• Large-cap stocks: 35%\n• Mid-cap stocks: 15%\n• International stocks: 10%",
-            'aggressive': "• Bonds: 20%\n• Large-cap stocks: 40%\n• Mid-cap stocks: 20%\n• Small-cap stocks: 10%\n• International stocks: 10%"
-        }
-        return allocations.get(risk_tolerance, allocations['moderate'])
+        return _ASSET_ALLOCATIONS_BY_RISK.get(risk_tolerance, _ASSET_ALLOCATIONS_BY_RISK['moderate'])
 
     def _get_investment_recommendations_by_risk(self, risk_tolerance: str) -> str:
         """Get investment recommendations by risk tolerance"""
-        recommendations = {
-            'conservative': "• VOO (S&P 500 ETF)\n• BND (Total Bond Market)\n• VXUS (International Stocks)",
-            'moderate': "• VTI (Total Stock Market)\n• BND (Total Bond Market)\n• VXUS (International Stocks)\n• QQQ (Technology)",
-            'aggressive': "• VTI (Total Stock Market)\n• QQQ (Technology)\n• VXUS (International Stocks)\n• VB (Small-cap stocks)"
-        }
-        return recommendations.get(risk_tolerance, recommendations['moderate'])
+        return _INVESTMENT_RECOMMENDATIONS_BY_RISK.get(risk_tolerance, _INVESTMENT_RECOMMENDATIONS_BY_RISK['moderate'])
 
     def _get_predicted_range(self, symbol: str) -> str:
         """Get predicted price range for symbol"""
-        ranges = {
-            'AAPL': '150-170',
-            'NVDA': '450-550',
-            'TSLA': '200-250',
-            'MSFT': '350-400',
-            'GOOGL': '130-150'
-        }
-        return ranges.get(symbol, 'Varies')
+        return _PREDICTED_RANGES.get(symbol, 'Varies')
 
     def _get_support_level(self, symbol: str) -> str:
         """Get support level for symbol"""
-        supports = {
-            'AAPL': '155',
-            'NVDA': '480',
-            'TSLA': '220',
-            'MSFT': '360',
-            'GOOGL': '135'
-        }
-        return supports.get(symbol, 'Varies')
+        return _SUPPORT_LEVELS.get(symbol, 'Varies')
 
     def _get_resistance_level(self, symbol: str) -> str:
         """Get resistance level for symbol"""
-        resistances = {
-            'AAPL': '165',
-            'NVDA': '520',
-            'TSLA': '240',
-            'MSFT': '380',
-            'GOOGL': '145'
-        }
-        return resistances.get(symbol, 'Varies') 
\ No newline at end of file
+        return _RESISTANCE_LEVELS.get(symbol, 'Varies')
@@ -4,20 +4,36 @@ Portfolio Management System
 Handles capital allocation, AI analysis, buy/sell signals, performance tracking, and rebalancing.
 """
 
-import pandas as pd
 import numpy as np
 import logging
+import math
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
+import gzip
 import json
 import os
+import stat
+import sys
+import tempfile
+import threading
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses drop the per-instance __dict__ (slots= needs Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 class SignalType(Enum):
     BUY = "BUY"
     SELL = "SELL"
@@ -30,7 +46,99 @@ class AssetType(Enum):
     CRYPTO = "CRYPTO"
     ETF = "ETF"
 
-@dataclass
+# AssetType members by their serialized value
+_ASSET_TYPES = {asset_type.value: asset_type for asset_type in AssetType}
+
+# Crypto symbols (simplified)
+_CRYPTO_SYMBOLS = frozenset({'BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'LTC', 'BCH', 'XRP', 'SOL', 'AVAX'})
+_ETF_SYMBOLS = frozenset({'SPY', 'QQQ', 'VTI', 'VOO', 'GLD', 'SLV', 'ARKK'})
+
+@lru_cache(maxsize=4096)
+def _asset_type_for(symbol: str) -> AssetType:
+    """Classify a symbol; cached since the same symbols recur across signals and trades."""
+    symbol = symbol.upper()
+    if symbol in _CRYPTO_SYMBOLS:
+        return AssetType.CRYPTO
+    elif symbol.endswith('X'):  # Common crypto pattern
+        return AssetType.CRYPTO
+    elif symbol in _ETF_SYMBOLS:
+        return AssetType.ETF
+    else:
+        return AssetType.STOCK
+
+# Reasoning text for each signal tier produced by _score_prediction
+_PREDICTION_REASONS = {
+    SignalType.STRONG_BUY: "Strong AI prediction: %.1f%% upside",
+    SignalType.BUY: "AI prediction: %.1f%% upside",
+    SignalType.STRONG_SELL: "Strong AI prediction: %.1f%% downside",
+    SignalType.SELL: "AI prediction: %.1f%% downside"
+}
+
+# Signal tier by [price change bucket][confidence bucket]. Price change buckets
+# are < -10, -10..-5, -5..5, 5..10 and > 10 percent; confidence buckets are
+# <= 0.6, 0.6..0.7 and > 0.7.
+_PREDICTION_TABLE = (
+    (SignalType.HOLD, SignalType.SELL, SignalType.STRONG_SELL),
+    (SignalType.HOLD, SignalType.SELL, SignalType.SELL),
+    (SignalType.HOLD, SignalType.HOLD, SignalType.HOLD),
+    (SignalType.HOLD, SignalType.BUY, SignalType.BUY),
+    (SignalType.HOLD, SignalType.BUY, SignalType.STRONG_BUY)
+)
+_PREDICTION_TABLE_ARRAY = np.array(_PREDICTION_TABLE, dtype=object)
+
+def _score_prediction(price_change_pct: float, prediction_confidence: float) -> SignalType:
+    """Map a predicted price change and its confidence to a signal tier."""
+    change_bucket = (2 + (price_change_pct > 5) + (price_change_pct > 10)
+                     - (price_change_pct < -5) - (price_change_pct < -10))
+    if change_bucket == 2:
+        return SignalType.HOLD
+    confidence_bucket = (prediction_confidence > 0.6) + (prediction_confidence > 0.7)
+    return _PREDICTION_TABLE[change_bucket][confidence_bucket]
+
+def _score_predictions(analyses: List[Dict]) -> List[Optional[Tuple[SignalType, float]]]:
+    """
+    Score the AI predictions of a batch of analyses with array operations.
+    
+    Returns (signal tier, price change %) per analysis, or None where there is
+    no prediction or its inputs are not plain numbers; those are left to the
+    per-symbol path in _generate_signal_from_analysis.
+    """
+    scores = [None] * len(analyses)
+    rows = []
+    inputs = []
+    
+    for i, analysis in enumerate(analyses):
+        try:
+            prediction = analysis.get('prediction', {})
+            if not prediction:
+                continue
+            current_price = analysis.get('technical', {}).get('latest_data', {}).get('Close', 100.0)
+            predicted_price = prediction.get('predicted_price', current_price)
+            prediction_confidence = prediction.get('confidence', 0.5)
+        except AttributeError:
+            continue
+        
+        values = (current_price, predicted_price, prediction_confidence)
+        if current_price and all(isinstance(value, (int, float)) for value in values):
+            rows.append(i)
+            inputs.append(values)
+    
+    if not rows:
+        return scores
+    
+    current_price, predicted_price, prediction_confidence = np.array(inputs, dtype=np.float64).T
+    price_change_pct = ((predicted_price - current_price) / current_price) * 100
+    change_bucket = (2 + (price_change_pct > 5).astype(np.intp) + (price_change_pct > 10)
+                     - (price_change_pct < -5) - (price_change_pct < -10))
+    confidence_bucket = (prediction_confidence > 0.6).astype(np.intp) + (prediction_confidence > 0.7)
+    tiers = _PREDICTION_TABLE_ARRAY[change_bucket, confidence_bucket]
+    
+    for i, tier, pct in zip(rows, tiers.tolist(), price_change_pct.tolist()):
+        scores[i] = (tier, pct)
+    
+    return scores
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Asset:
     symbol: str
     name: str
@@ -40,7 +148,7 @@ class Asset:
     avg_cost: float = 0.0
     target_allocation: float = 0.0
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Signal:
     symbol: str
     signal_type: SignalType
@@ -51,28 +159,308 @@ class Signal:
     target_price: Optional[float] = None
     stop_loss: Optional[float] = None
 
-@dataclass
+class SignalStore:
+    """
+    Bounded signal history kept as parallel column arrays.
+    
+    Holds the most recent `capacity` signals in a ring buffer and rebuilds
+    Signal objects only when entries are read back. Supports len(), indexing,
+    slicing and iteration in oldest-to-newest order, like the list it replaces.
+    """
+    
+    _SIGNAL_TYPES = tuple(SignalType)
+    _SIGNAL_CODES = {signal_type: code for code, signal_type in enumerate(_SIGNAL_TYPES)}
+    
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self._count = 0  # signals appended so far, including overwritten ones
+        self._allocate(min(capacity, 64))
+    
+    def _allocate(self, size: int):
+        """Allocate (or grow) the columns to hold `size` signals."""
+        columns = {
+            '_symbols': np.empty(size, dtype=object),
+            '_signal_types': np.empty(size, dtype=np.int8),
+            '_confidence': np.empty(size, dtype=np.float64),
+            '_price': np.empty(size, dtype=np.float64),
+            '_timestamps': np.empty(size, dtype='datetime64[us]'),
+            '_reasoning': np.empty(size, dtype=object),
+            '_target_price': np.empty(size, dtype=np.float64),
+            '_stop_loss': np.empty(size, dtype=np.float64)
+        }
+        for name, column in columns.items():
+            if self._count:
+                column[:self._count] = getattr(self, name)[:self._count]
+            setattr(self, name, column)
+    
+    def append(self, signal: Signal):
+        """Record a signal, overwriting the oldest one once the store is full."""
+        size = len(self._price)
+        if self._count == size and size < self.capacity:
+            self._allocate(min(size * 2, self.capacity))
+        
+        i = self._count % self.capacity
+        self._symbols[i] = signal.symbol
+        self._signal_types[i] = self._SIGNAL_CODES[signal.signal_type]
+        self._confidence[i] = signal.confidence
+        self._price[i] = signal.price
+        self._timestamps[i] = signal.timestamp
+        self._reasoning[i] = signal.reasoning
+        self._target_price[i] = np.nan if signal.target_price is None else signal.target_price
+        self._stop_loss[i] = np.nan if signal.stop_loss is None else signal.stop_loss
+        self._count += 1
+    
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+    
+    def __getitem__(self, key):
+        positions = range(len(self))[key]
+        if isinstance(key, slice):
+            return self._build(np.asarray(positions, dtype=np.int64))
+        return self._build(np.array([positions]))[0]
+    
+    def __iter__(self):
+        return iter(self[:])
+    
+    def _build(self, positions: np.ndarray) -> List[Signal]:
+        """Rebuild Signal objects for logical positions (0 = oldest kept signal)."""
+        rows = (positions + max(self._count - self.capacity, 0)) % self.capacity
+        target_prices = self._target_price[rows]
+        stop_losses = self._stop_loss[rows]
+        return [
+            Signal(
+                symbol=symbol,
+                signal_type=self._SIGNAL_TYPES[code],
+                confidence=confidence,
+                price=price,
+                timestamp=timestamp,
+                reasoning=reasoning,
+                target_price=None if target_price != target_price else target_price,
+                stop_loss=None if stop_loss != stop_loss else stop_loss
+            )
+            for symbol, code, confidence, price, timestamp, reasoning, target_price, stop_loss in zip(
+                self._symbols[rows].tolist(), self._signal_types[rows].tolist(),
+                self._confidence[rows].tolist(), self._price[rows].tolist(),
+                self._timestamps[rows].tolist(), self._reasoning[rows].tolist(),
+                target_prices.tolist(), stop_losses.tolist()
+            )
+        ]
+
+class PerformanceHistory:
+    """
+    Portfolio performance records kept as parallel column arrays.
+    
+    Behaves like the list of record dicts it replaces (append, len(), indexing,
+    slicing, iteration); records are rebuilt as dicts when read, while metric
+    calculations use the dates, values and daily_returns columns directly.
+    """
+    
+    def __init__(self):
+        self._count = 0
+        self._allocate(64)
+    
+    def _allocate(self, size: int):
+        """Allocate (or grow) the columns to hold `size` records."""
+        columns = {
+            '_dates': np.empty(size, dtype='datetime64[us]'),
+            '_total_value': np.empty(size, dtype=np.float64),
+            '_total_return': np.empty(size, dtype=np.float64),
+            '_daily_return': np.empty(size, dtype=np.float64),
+            '_available_cash': np.empty(size, dtype=np.float64),
+            '_num_assets': np.empty(size, dtype=np.int64)
+        }
+        for name, column in columns.items():
+            if self._count:
+                column[:self._count] = getattr(self, name)[:self._count]
+            setattr(self, name, column)
+    
+    def append(self, record: Dict):
+        """Add a performance record, doubling the columns when they are full."""
+        if self._count == len(self._dates):
+            self._allocate(self._count * 2)
+        
+        i = self._count
+        self._dates[i] = record['date']
+        self._total_value[i] = record['total_value']
+        self._total_return[i] = record['total_return']
+        self._daily_return[i] = record['daily_return']
+        self._available_cash[i] = record['available_cash']
+        self._num_assets[i] = record['num_assets']
+        self._count += 1
+    
+    @property
+    def dates(self) -> np.ndarray:
+        return self._dates[:self._count]
+    
+    @property
+    def values(self) -> np.ndarray:
+        return self._total_value[:self._count]
+    
+    @property
+    def daily_returns(self) -> np.ndarray:
+        return self._daily_return[:self._count]
+    
+    def since(self, cutoff: datetime) -> List[Dict]:
+        """Return the records dated at or after `cutoff`."""
+        # Records are appended in time order, so the dates column is sorted
+        start = int(np.searchsorted(self.dates, np.datetime64(cutoff, 'us'), side='left'))
+        return self[start:]
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __getitem__(self, key):
+        positions = range(self._count)[key]
+        if isinstance(key, slice):
+            return self._build(np.asarray(positions, dtype=np.int64))
+        return self._build(np.array([positions]))[0]
+    
+    def __iter__(self):
+        return iter(self[:])
+    
+    def _build(self, rows: np.ndarray) -> List[Dict]:
+        """Rebuild record dicts for the given rows."""
+        return [
+            {
+                'date': date,
+                'total_value': total_value,
+                'total_return': total_return,
+                'daily_return': daily_return,
+                'available_cash': available_cash,
+                'num_assets': num_assets
+            }
+            for date, total_value, total_return, daily_return, available_cash, num_assets in zip(
+                self._dates[rows].tolist(), self._total_value[rows].tolist(),
+                self._total_return[rows].tolist(), self._daily_return[rows].tolist(),
+                self._available_cash[rows].tolist(), self._num_assets[rows].tolist()
+            )
+        ]
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Portfolio:
     total_capital: float
     available_cash: float
     total_value: float
     assets: Dict[str, Asset]
-    performance_history: List[Dict]
-    signals_history: List[Signal]
+    performance_history: PerformanceHistory
+    signals_history: SignalStore
     created_at: datetime
     last_rebalance: Optional[datetime] = None
 
+_GZIP_MAGIC = b'\x1f\x8b'
+
+def _json_default(obj):
+    """Encode the datetime and Enum values in a state dict for the stdlib json fallback."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _write_state_file(filename: str, state: Dict, pretty: bool = False):
+    """
+    Atomically write a portfolio state dict as JSON, using orjson when installed.
+    
+    Output is compact unless `pretty` is set, in which case it is indented
+    for reading by hand.
+    
+    datetime and Enum values may be left in the state; both encoders write them
+    as ISO-8601 strings and enum values respectively. Filenames ending in '.gz'
+    are gzip-compressed.
+    """
+    # Serialize to one buffer so the file is written with a single write()
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        data = orjson.dumps(state, option=option)
+    elif pretty:
+        data = json.dumps(state, indent=2, default=_json_default).encode()
+    else:
+        data = json.dumps(state, separators=(',', ':'), default=_json_default).encode()
+    if filename.endswith('.gz'):
+        # Level 1 gets most of the size reduction on repetitive JSON at little CPU cost
+        data = gzip.compress(data, compresslevel=1)
+    
+    # Write to a uniquely named sibling temp file and swap it in, so a crash
+    # mid-write never leaves a truncated snapshot and concurrent saves never
+    # share a temp file
+    fd, tmp_filename = tempfile.mkstemp(
+        dir=os.path.dirname(filename) or '.',
+        prefix=os.path.basename(filename) + '.',
+        suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; keep the mode of the file being replaced
+        try:
+            os.chmod(tmp_filename, stat.S_IMODE(os.stat(filename).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        try:
+            os.unlink(tmp_filename)
+        except FileNotFoundError:
+            pass
+        raise
+
+def _read_state_file(filename: str) -> Dict:
+    """Read a portfolio state file written by _write_state_file."""
+    with open(filename, 'rb') as f:
+        data = f.read()
+    # Detect compression from the content so renamed files still load
+    if data[:2] == _GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _history_log_filename(filename: str) -> str:
+    """Path of the append-only performance history log kept beside a state file."""
+    return filename + '.perf.ndjson'
+
+def _write_history_records(filename: str, records: List[Dict], append: bool):
+    """Write performance records to a history log, one JSON object per line."""
+    if ORJSON_AVAILABLE:
+        data = b''.join(orjson.dumps(record) + b'\n' for record in records)
+    else:
+        data = ''.join(json.dumps(record, default=_json_default) + '\n' for record in records).encode()
+    
+    with open(filename, 'ab' if append else 'wb', buffering=1 << 20) as f:
+        f.write(data)
+
+def _read_history_records(filename: str, history: PerformanceHistory) -> bool:
+    """
+    Append the performance records stored in a history log to `history`.
+    
+    Every record is written with its newline, so a last line without one was
+    cut short by a crash mid-append. It is skipped and False is returned.
+    """
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    fromisoformat = datetime.fromisoformat
+    with open(filename, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                return False
+            if line.strip():
+                record = loads(line)
+                record['date'] = fromisoformat(record['date'])
+                history.append(record)
+    return True
+
 class PortfolioManager:
-    def __init__(self, initial_capital: float, ai_predictor=None):
+    def __init__(self, initial_capital: float, ai_predictor=None, pretty_json: bool = False):
         """
         Initialize portfolio manager with initial capital.
         
         Args:
             initial_capital: Starting capital in dollars
             ai_predictor: AI predictor instance for analysis
+            pretty_json: Indent saved state files for manual inspection
         """
         self.initial_capital = initial_capital
         self.ai_predictor = ai_predictor
+        self.pretty_json = pretty_json
         self.portfolio = self._initialize_portfolio()
         self.risk_tolerance = "moderate"  # conservative, moderate, aggressive
         self.rebalance_threshold = 0.05  # 5% deviation triggers rebalancing
@@ -88,6 +476,20 @@ class PortfolioManager:
             'max_drawdown': 0.0,
             'win_rate': 0.0
         }
+        self._reset_performance_stats()
+        
+        # (history log filename, records already written to it) for incremental saves;
+        # the lock keeps concurrent saves from appending the same records twice
+        self._history_log = None
+        self._history_log_lock = threading.Lock()
+        
+        # Recent AI analyses by symbol as (monotonic time, analysis), oldest first;
+        # analyses run on worker threads, so the lock guards eviction
+        self.analysis_cache_ttl = 60.0  # seconds
+        self.analysis_cache_size = 256
+        self._analysis_cache = {}
+        self._analysis_cache_lock = threading.Lock()
+        self.max_analysis_workers = 16
         
         logger.info(f"Portfolio Manager initialized with ${initial_capital:,.2f}")
 
@@ -98,8 +500,8 @@ class PortfolioManager:
             available_cash=self.initial_capital,
             total_value=self.initial_capital,
             assets={},
-            performance_history=[],
-            signals_history=[],
+            performance_history=PerformanceHistory(),
+            signals_history=SignalStore(),
             created_at=datetime.now(),
             last_rebalance=None
         )
@@ -133,6 +535,11 @@ class PortfolioManager:
                 logger.warning("No AI predictor available, using basic analysis")
                 return self._basic_analysis(symbol)
             
+            # Reuse a recent analysis; predictions do not change within a bar
+            cached = self._analysis_cache.get(symbol)
+            if cached and time.monotonic() - cached[0] < self.analysis_cache_ttl:
+                return cached[1]
+            
             # Get AI analysis
             analysis = {}
             
@@ -156,12 +563,27 @@ class PortfolioManager:
             if recommendations:
                 analysis['recommendations'] = recommendations
             
+            self._cache_analysis(symbol, analysis)
             return analysis
             
         except Exception as e:
             logger.error(f"Error analyzing {symbol}: {str(e)}")
             return self._basic_analysis(symbol)
 
+    def _cache_analysis(self, symbol: str, analysis: Dict):
+        """Store a fresh analysis, evicting expired entries and the oldest beyond the size cap."""
+        now = time.monotonic()
+        cache = self._analysis_cache
+        with self._analysis_cache_lock:
+            # Re-insert so the dict stays ordered by insertion time
+            cache.pop(symbol, None)
+            cache[symbol] = (now, analysis)
+            while cache:
+                oldest = next(iter(cache))
+                if len(cache) <= self.analysis_cache_size and now - cache[oldest][0] < self.analysis_cache_ttl:
+                    break
+                del cache[oldest]
+
     def _basic_analysis(self, symbol: str) -> Dict:
         """Basic analysis when AI is not available."""
         return {
@@ -187,45 +609,77 @@ class PortfolioManager:
             asset_types = [AssetType.STOCK, AssetType.CRYPTO, AssetType.ETF]
         
         signals = []
+        eligible = []
         
         for symbol in watchlist:
             try:
                 # Determine asset type (simplified logic)
                 asset_type = self._determine_asset_type(symbol)
-                if asset_type not in asset_types:
-                    continue
-                
-                # Analyze asset
-                analysis = self.analyze_asset_with_ai(symbol, asset_type)
+                if asset_type in asset_types:
+                    eligible.append((symbol, asset_type))
                 
+            except Exception as e:
+                logger.error("Error generating signal for %s: %s", symbol, e)
+        
+        # Analyze assets
+        analyzed = self._analyze_assets(eligible)
+        
+        # Score every AI prediction in the watchlist in one pass
+        prediction_scores = _score_predictions([analysis for _, _, analysis in analyzed])
+        now = datetime.now()
+        
+        for (symbol, asset_type, analysis), prediction_score in zip(analyzed, prediction_scores):
+            try:
                 # Generate signal based on analysis
-                signal = self._generate_signal_from_analysis(symbol, analysis, asset_type)
+                signal = self._generate_signal_from_analysis(symbol, analysis, asset_type, prediction_score, now)
                 if signal:
                     signals.append(signal)
                     self.portfolio.signals_history.append(signal)
                 
             except Exception as e:
-                logger.error(f"Error generating signal for {symbol}: {str(e)}")
+                logger.error("Error generating signal for %s: %s", symbol, e)
         
-        logger.info(f"Generated {len(signals)} signals")
+        logger.info("Generated %d signals", len(signals))
         return signals
 
+    def _analyze_assets(self, assets: List[Tuple[str, AssetType]]) -> List[Tuple[str, AssetType, Dict]]:
+        """
+        Run analyze_asset_with_ai for each (symbol, asset type) pair.
+        
+        Predictor calls are network-bound, so with an AI predictor they run on a
+        thread pool; results keep the input order.
+        """
+        if not self.ai_predictor or len(assets) < 2:
+            return [(symbol, asset_type, self.analyze_asset_with_ai(symbol, asset_type))
+                    for symbol, asset_type in assets]
+        
+        analyzed = []
+        with ThreadPoolExecutor(max_workers=min(self.max_analysis_workers, len(assets))) as executor:
+            futures = [executor.submit(self.analyze_asset_with_ai, symbol, asset_type)
+                       for symbol, asset_type in assets]
+            for (symbol, asset_type), future in zip(assets, futures):
+                try:
+                    analyzed.append((symbol, asset_type, future.result()))
+                except Exception as e:
+                    logger.error("Error generating signal for %s: %s", symbol, e)
+        
+        return analyzed
+
     def _determine_asset_type(self, symbol: str) -> AssetType:
         """Determine asset type based on symbol."""
-        # Crypto symbols (simplified)
-        crypto_symbols = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'LTC', 'BCH', 'XRP', 'SOL', 'AVAX']
-        
-        if symbol.upper() in crypto_symbols:
-            return AssetType.CRYPTO
-        elif symbol.upper().endswith('X'):  # Common crypto pattern
-            return AssetType.CRYPTO
-        elif symbol.upper() in ['SPY', 'QQQ', 'VTI', 'VOO', 'GLD', 'SLV', 'ARKK']:
-            return AssetType.ETF
-        else:
-            return AssetType.STOCK
+        return _asset_type_for(symbol)
 
-    def _generate_signal_from_analysis(self, symbol: str, analysis: Dict, asset_type: AssetType) -> Optional[Signal]:
-        """Generate trading signal from AI analysis."""
+    def _generate_signal_from_analysis(self, symbol: str, analysis: Dict, asset_type: AssetType,
+                                       prediction_score: Optional[Tuple[SignalType, float]] = None,
+                                       timestamp: Optional[datetime] = None) -> Optional[Signal]:
+        """
+        Generate trading signal from AI analysis.
+        
+        Args:
+            prediction_score: (signal tier, price change %) already computed by
+                _score_predictions; scored here when not supplied
+            timestamp: Signal time shared by a batch (defaults to now)
+        """
         try:
             # Extract key metrics
             current_price = analysis.get('technical', {}).get('latest_data', {}).get('Close', 100.0)
@@ -245,26 +699,17 @@ class PortfolioManager:
                 predicted_price = prediction.get('predicted_price', current_price)
                 prediction_confidence = prediction.get('confidence', 0.5)
                 
-                price_change_pct = ((predicted_price - current_price) / current_price) * 100
-                
-                if price_change_pct > 10 and prediction_confidence > 0.7:
-                    signal_type = SignalType.STRONG_BUY
-                    confidence = prediction_confidence
-                    reasoning.append(f"Strong AI prediction: {price_change_pct:.1f}% upside")
-                    target_price = predicted_price
-                elif price_change_pct > 5 and prediction_confidence > 0.6:
-                    signal_type = SignalType.BUY
-                    confidence = prediction_confidence
-                    reasoning.append(f"AI prediction: {price_change_pct:.1f}% upside")
-                    target_price = predicted_price
-                elif price_change_pct < -10 and prediction_confidence > 0.7:
-                    signal_type = SignalType.STRONG_SELL
-                    confidence = prediction_confidence
-                    reasoning.append(f"Strong AI prediction: {abs(price_change_pct):.1f}% downside")
-                elif price_change_pct < -5 and prediction_confidence > 0.6:
-                    signal_type = SignalType.SELL
+                if prediction_score is None:
+                    price_change_pct = ((predicted_price - current_price) / current_price) * 100
+                    prediction_signal = _score_prediction(price_change_pct, prediction_confidence)
+                else:
+                    prediction_signal, price_change_pct = prediction_score
+                if prediction_signal != SignalType.HOLD:
+                    signal_type = prediction_signal
                     confidence = prediction_confidence
-                    reasoning.append(f"AI prediction: {abs(price_change_pct):.1f}% downside")
+                    reasoning.append(_PREDICTION_REASONS[prediction_signal] % abs(price_change_pct))
+                    if prediction_signal in (SignalType.BUY, SignalType.STRONG_BUY):
+                        target_price = predicted_price
             
             # Technical analysis
             if technical:
@@ -326,7 +771,7 @@ class PortfolioManager:
                 signal_type=signal_type,
                 confidence=confidence,
                 price=current_price,
-                timestamp=datetime.now(),
+                timestamp=timestamp or datetime.now(),
                 reasoning="; ".join(reasoning) if reasoning else "No clear signal",
                 target_price=target_price,
                 stop_loss=stop_loss
@@ -363,7 +808,7 @@ class PortfolioManager:
                     if symbol in self.portfolio.assets:
                         quantity = self.portfolio.assets[symbol].quantity
                     else:
-                        logger.warning(f"No position in {symbol} to sell")
+                        logger.warning("No position in %s to sell", symbol)
                         return False
             
             # Execute trade
@@ -372,11 +817,11 @@ class PortfolioManager:
             elif signal.signal_type in [SignalType.SELL, SignalType.STRONG_SELL]:
                 return self._sell_asset(symbol, quantity, current_price)
             else:
-                logger.info(f"HOLD signal for {symbol} - no action taken")
+                logger.info("HOLD signal for %s - no action taken", symbol)
                 return True
                 
         except Exception as e:
-            logger.error(f"Error executing signal for {signal.symbol}: {str(e)}")
+            logger.error("Error executing signal for %s: %s", signal.symbol, e)
             return False
 
     def _buy_asset(self, symbol: str, quantity: float, price: float) -> bool:
@@ -385,7 +830,7 @@ class PortfolioManager:
             total_cost = quantity * price
             
             if total_cost > self.portfolio.available_cash:
-                logger.warning(f"Insufficient cash for {symbol} purchase")
+                logger.warning("Insufficient cash for %s purchase", symbol)
                 return False
             
             # Update portfolio
@@ -408,28 +853,28 @@ class PortfolioManager:
                 )
                 self.portfolio.assets[symbol] = asset
             
-            # Update cash and total value
+            # Update cash and total value; only this position's valuation changed
             self.portfolio.available_cash -= total_cost
-            self.portfolio.total_value = self._calculate_total_value()
+            self.portfolio.total_value += quantity * asset.current_price - total_cost
             
-            logger.info(f"Bought {quantity:.2f} {symbol} at ${price:.2f}")
+            logger.info("Bought %.2f %s at $%.2f", quantity, symbol, price)
             return True
             
         except Exception as e:
-            logger.error(f"Error buying {symbol}: {str(e)}")
+            logger.error("Error buying %s: %s", symbol, e)
             return False
 
     def _sell_asset(self, symbol: str, quantity: float, price: float) -> bool:
         """Sell an asset."""
         try:
             if symbol not in self.portfolio.assets:
-                logger.warning(f"No position in {symbol} to sell")
+                logger.warning("No position in %s to sell", symbol)
                 return False
             
             asset = self.portfolio.assets[symbol]
             
             if quantity > asset.quantity:
-                logger.warning(f"Insufficient quantity of {symbol} to sell")
+                logger.warning("Insufficient quantity of %s to sell", symbol)
                 return False
             
             # Calculate proceeds
@@ -442,33 +887,42 @@ class PortfolioManager:
                 # Remove asset if fully sold
                 del self.portfolio.assets[symbol]
             
-            # Update cash and total value
+            # Update cash and total value; only this position's valuation changed
             self.portfolio.available_cash += proceeds
-            self.portfolio.total_value = self._calculate_total_value()
+            self.portfolio.total_value += proceeds - quantity * asset.current_price
             
-            logger.info(f"Sold {quantity:.2f} {symbol} at ${price:.2f}")
+            logger.info("Sold %.2f %s at $%.2f", quantity, symbol, price)
             return True
             
         except Exception as e:
-            logger.error(f"Error selling {symbol}: {str(e)}")
+            logger.error("Error selling %s: %s", symbol, e)
             return False
 
+    def _position_arrays(self, *fields: str, assets: Optional[List[Asset]] = None) -> Tuple[np.ndarray, ...]:
+        """Return the given Asset fields as float arrays, one slot per asset (default: all held)."""
+        if assets is None:
+            assets = self.portfolio.assets.values()
+        count = len(assets)
+        return tuple(
+            np.fromiter((getattr(asset, field) for asset in assets), dtype=np.float64, count=count)
+            for field in fields
+        )
+
     def _calculate_total_value(self) -> float:
-        """Calculate total portfolio value."""
-        total = self.portfolio.available_cash
-        
-        for asset in self.portfolio.assets.values():
-            total += asset.quantity * asset.current_price
-        
-        return total
+        """Calculate total portfolio value from scratch (trades and price updates adjust it incrementally)."""
+        quantities, prices = self._position_arrays('quantity', 'current_price')
+        return self.portfolio.available_cash + float(np.dot(quantities, prices))
 
     def update_prices(self, price_updates: Dict[str, float]):
-        """Update asset prices and recalculate portfolio value."""
+        """Update asset prices and adjust portfolio value by the price changes."""
+        with self._analysis_cache_lock:
+            for symbol in price_updates:
+                self._analysis_cache.pop(symbol, None)
         for symbol, price in price_updates.items():
             if symbol in self.portfolio.assets:
-                self.portfolio.assets[symbol].current_price = price
-        
-        self.portfolio.total_value = self._calculate_total_value()
+                asset = self.portfolio.assets[symbol]
+                self.portfolio.total_value += (price - asset.current_price) * asset.quantity
+                asset.current_price = price
 
     def track_performance(self) -> Dict:
         """Track portfolio performance metrics."""
@@ -478,7 +932,7 @@ class PortfolioManager:
             
             # Calculate daily return
             if self.portfolio.performance_history:
-                yesterday_value = self.portfolio.performance_history[-1]['total_value']
+                yesterday_value = self.portfolio.performance_history.values[-1].item()
                 daily_return = ((current_value - yesterday_value) / yesterday_value) * 100
             else:
                 daily_return = 0.0
@@ -496,7 +950,7 @@ class PortfolioManager:
             self.portfolio.performance_history.append(performance_record)
             
             # Calculate additional metrics
-            self._calculate_performance_metrics()
+            self._update_performance_metrics(performance_record)
             
             return {
                 'total_return': total_return,
@@ -511,47 +965,85 @@ class PortfolioManager:
             logger.error(f"Error tracking performance: {str(e)}")
             return {}
 
+    def _reset_performance_stats(self):
+        """Clear the running statistics behind performance_metrics."""
+        self._return_count = 0
+        self._return_mean = 0.0
+        self._return_m2 = 0.0
+        self._positive_days = 0
+        self._peak_value = None
+        self._max_drawdown = 0.0
+
+    def _update_performance_metrics(self, record: Dict):
+        """Fold one new performance record into the running metrics."""
+        try:
+            daily_return = record['daily_return']
+            value = record['total_value']
+            
+            # Welford update of the daily return mean and variance
+            self._return_count += 1
+            delta = daily_return - self._return_mean
+            self._return_mean += delta / self._return_count
+            self._return_m2 += delta * (daily_return - self._return_mean)
+            if daily_return > 0:
+                self._positive_days += 1
+            
+            # Drawdown against the running peak
+            if self._peak_value is None or value > self._peak_value:
+                self._peak_value = value
+            self._max_drawdown = max(self._max_drawdown, (self._peak_value - value) / self._peak_value)
+            
+            if self._return_count >= 2:
+                self._publish_performance_metrics(daily_return)
+            
+        except Exception as e:
+            logger.error(f"Error calculating performance metrics: {str(e)}")
+
     def _calculate_performance_metrics(self):
-        """Calculate advanced performance metrics."""
+        """Recalculate the running statistics and metrics from the full history."""
         try:
-            if len(self.portfolio.performance_history) < 2:
+            history = self.portfolio.performance_history
+            self._reset_performance_stats()
+            if not history:
                 return
             
-            # Extract daily returns
-            daily_returns = []
-            values = []
-            
-            for record in self.portfolio.performance_history:
-                daily_returns.append(record['daily_return'])
-                values.append(record['total_value'])
-            
-            # Calculate metrics
-            self.performance_metrics['total_return'] = daily_returns[-1] if daily_returns else 0.0
-            self.performance_metrics['daily_return'] = daily_returns[-1] if daily_returns else 0.0
-            self.performance_metrics['volatility'] = np.std(daily_returns) if len(daily_returns) > 1 else 0.0
-            
-            # Sharpe ratio (simplified)
-            if self.performance_metrics['volatility'] > 0:
-                avg_return = np.mean(daily_returns)
-                self.performance_metrics['sharpe_ratio'] = avg_return / self.performance_metrics['volatility']
-            
-            # Maximum drawdown
-            peak = values[0]
-            max_dd = 0.0
-            for value in values:
-                if value > peak:
-                    peak = value
-                dd = (peak - value) / peak
-                max_dd = max(max_dd, dd)
-            self.performance_metrics['max_drawdown'] = max_dd * 100
-            
-            # Win rate (simplified)
-            positive_days = sum(1 for r in daily_returns if r > 0)
-            self.performance_metrics['win_rate'] = (positive_days / len(daily_returns)) * 100 if daily_returns else 0.0
+            count = len(history)
+            daily_returns = history.daily_returns
+            values = history.values
+            
+            self._return_count = count
+            self._return_mean = float(np.mean(daily_returns))
+            self._return_m2 = float(np.var(daily_returns)) * count
+            self._positive_days = int(np.count_nonzero(daily_returns > 0))
+            
+            # Maximum drawdown against the running peak
+            peaks = np.maximum.accumulate(values)
+            self._peak_value = float(peaks[-1])
+            self._max_drawdown = max(float(((peaks - values) / peaks).max()), 0.0)
+            
+            if count >= 2:
+                self._publish_performance_metrics(float(daily_returns[-1]))
             
         except Exception as e:
             logger.error(f"Error calculating performance metrics: {str(e)}")
 
+    def _publish_performance_metrics(self, latest_return: float):
+        """Copy the running statistics into performance_metrics."""
+        volatility = math.sqrt(self._return_m2 / self._return_count)
+        
+        self.performance_metrics['total_return'] = latest_return
+        self.performance_metrics['daily_return'] = latest_return
+        self.performance_metrics['volatility'] = volatility
+        
+        # Sharpe ratio (simplified)
+        if volatility > 0:
+            self.performance_metrics['sharpe_ratio'] = self._return_mean / volatility
+        
+        self.performance_metrics['max_drawdown'] = self._max_drawdown * 100
+        
+        # Win rate (simplified)
+        self.performance_metrics['win_rate'] = (self._positive_days / self._return_count) * 100
+
     def check_rebalancing_needed(self) -> bool:
         """Check if portfolio rebalancing is needed."""
         try:
@@ -562,16 +1054,17 @@ class PortfolioManager:
             if total_value == 0:
                 return False
             
-            # Check each asset's allocation
-            for symbol, asset in self.portfolio.assets.items():
-                current_allocation = (asset.quantity * asset.current_price) / total_value
-                target_allocation = asset.target_allocation
-                
-                if target_allocation > 0:
-                    deviation = abs(current_allocation - target_allocation)
-                    if deviation > self.rebalance_threshold:
-                        logger.info(f"Rebalancing needed: {symbol} deviation {deviation:.2%}")
-                        return True
+            # Check every asset's allocation against its target at once
+            quantities, prices, target_allocations = self._position_arrays(
+                'quantity', 'current_price', 'target_allocation')
+            deviations = np.abs((quantities * prices) / total_value - target_allocations)
+            breaches = np.flatnonzero((target_allocations > 0) & (deviations > self.rebalance_threshold))
+            
+            if breaches.size:
+                i = breaches[0]
+                symbol = list(self.portfolio.assets)[i]
+                logger.info(f"Rebalancing needed: {symbol} deviation {deviations[i]:.2%}")
+                return True
             
             return False
             
@@ -603,27 +1096,30 @@ class PortfolioManager:
             if total_value == 0:
                 return False
             
-            # Calculate target values and required trades
-            trades = []
-            
+            # Update target allocations of the held assets
+            symbols = []
+            assets = []
             for symbol, target_allocation in target_allocations.items():
                 if symbol in self.portfolio.assets:
                     asset = self.portfolio.assets[symbol]
-                    current_value = asset.quantity * asset.current_price
-                    target_value = total_value * target_allocation
-                    
-                    # Update target allocation
                     asset.target_allocation = target_allocation
-                    
-                    # Calculate required trade
-                    value_diff = target_value - current_value
-                    if abs(value_diff) > (total_value * 0.01):  # 1% minimum trade size
-                        quantity_diff = value_diff / asset.current_price
-                        trades.append({
-                            'symbol': symbol,
-                            'quantity': quantity_diff,
-                            'action': 'BUY' if quantity_diff > 0 else 'SELL'
-                        })
+                    symbols.append(symbol)
+                    assets.append(asset)
+            
+            # Calculate target values and required trades
+            quantities, prices, allocations = self._position_arrays(
+                'quantity', 'current_price', 'target_allocation', assets=assets)
+            value_diffs = total_value * allocations - quantities * prices
+            needs_trade = np.abs(value_diffs) > (total_value * 0.01)  # 1% minimum trade size
+            
+            trades = []
+            for i in np.flatnonzero(needs_trade).tolist():
+                quantity_diff = float(value_diffs[i]) / assets[i].current_price
+                trades.append({
+                    'symbol': symbols[i],
+                    'quantity': quantity_diff,
+                    'action': 'BUY' if quantity_diff > 0 else 'SELL'
+                })
             
             # Execute trades
             for trade in trades:
@@ -635,14 +1131,14 @@ class PortfolioManager:
                                              self.portfolio.assets[trade['symbol']].current_price)
                 
                 if not success:
-                    logger.warning(f"Failed to execute rebalancing trade for {trade['symbol']}")
+                    logger.warning("Failed to execute rebalancing trade for %s", trade['symbol'])
             
             self.portfolio.last_rebalance = datetime.now()
-            logger.info(f"Portfolio rebalancing completed with {len(trades)} trades")
+            logger.info("Portfolio rebalancing completed with %d trades", len(trades))
             return True
             
         except Exception as e:
-            logger.error(f"Error rebalancing portfolio: {str(e)}")
+            logger.error("Error rebalancing portfolio: %s", e)
             return False
 
     def get_portfolio_summary(self) -> Dict:
@@ -651,29 +1147,44 @@ class PortfolioManager:
             total_value = self.portfolio.total_value
             total_return = ((total_value - self.initial_capital) / self.initial_capital) * 100 if self.initial_capital > 0 else 0.0
             
-            # Asset breakdown
+            # Asset breakdown, computed for all assets at once
+            symbols = list(self.portfolio.assets)
+            assets = list(self.portfolio.assets.values())
+            quantities, prices, avg_costs = self._position_arrays(
+                'quantity', 'current_price', 'avg_cost', assets=assets)
+            asset_values = quantities * prices
+            cost_bases = quantities * avg_costs
+            unrealized_pnls = asset_values - cost_bases
+            if total_value > 0:
+                allocations = (asset_values / total_value) * 100
+            else:
+                allocations = np.zeros(len(assets))
+            unrealized_pnl_pcts = np.divide(unrealized_pnls, cost_bases, out=np.zeros(len(assets)),
+                                            where=cost_bases > 0) * 100
+            
+            # Sort by current value
+            order = np.argsort(-asset_values, kind='stable').tolist()
+            asset_values = asset_values.tolist()
+            allocations = allocations.tolist()
+            unrealized_pnls = unrealized_pnls.tolist()
+            unrealized_pnl_pcts = unrealized_pnl_pcts.tolist()
+            
             assets_summary = []
-            for symbol, asset in self.portfolio.assets.items():
-                asset_value = asset.quantity * asset.current_price
-                allocation = (asset_value / total_value) * 100 if total_value > 0 else 0
-                unrealized_pnl = asset_value - (asset.quantity * asset.avg_cost)
-                
+            for i in order:
+                asset = assets[i]
                 assets_summary.append({
-                    'symbol': symbol,
+                    'symbol': symbols[i],
                     'name': asset.name,
                     'asset_type': asset.asset_type.value,
                     'quantity': asset.quantity,
                     'current_price': asset.current_price,
                     'avg_cost': asset.avg_cost,
-                    'current_value': asset_value,
-                    'allocation': allocation,
-                    'unrealized_pnl': unrealized_pnl,
-                    'unrealized_pnl_pct': (unrealized_pnl / (asset.quantity * asset.avg_cost)) * 100 if asset.quantity * asset.avg_cost > 0 else 0
+                    'current_value': asset_values[i],
+                    'allocation': allocations[i],
+                    'unrealized_pnl': unrealized_pnls[i],
+                    'unrealized_pnl_pct': unrealized_pnl_pcts[i]
                 })
             
-            # Sort by current value
-            assets_summary.sort(key=lambda x: x['current_value'], reverse=True)
-            
             return {
                 'total_capital': self.portfolio.total_capital,
                 'total_value': total_value,
@@ -703,13 +1214,13 @@ class PortfolioManager:
                     'total_capital': self.portfolio.total_capital,
                     'available_cash': self.portfolio.available_cash,
                     'total_value': self.portfolio.total_value,
-                    'created_at': self.portfolio.created_at.isoformat(),
-                    'last_rebalance': self.portfolio.last_rebalance.isoformat() if self.portfolio.last_rebalance else None,
+                    'created_at': self.portfolio.created_at,
+                    'last_rebalance': self.portfolio.last_rebalance,
                     'assets': {
                         symbol: {
                             'symbol': asset.symbol,
                             'name': asset.name,
-                            'asset_type': asset.asset_type.value,
+                            'asset_type': asset.asset_type,
                             'current_price': asset.current_price,
                             'quantity': asset.quantity,
                             'avg_cost': asset.avg_cost,
@@ -723,8 +1234,16 @@ class PortfolioManager:
                 'rebalance_threshold': self.rebalance_threshold
             }
             
-            with open(filename, 'w') as f:
-                json.dump(state, f, indent=2)
+            with self._history_log_lock:
+                try:
+                    history_log = self._save_performance_history(filename)
+                    _write_state_file(filename, state, pretty=self.pretty_json)
+                except BaseException:
+                    # The log may hold records this manager can't account for,
+                    # so the next save rewrites it in full
+                    self._history_log = None
+                    raise
+                self._history_log = history_log
             
             logger.info(f"Portfolio state saved to {filename}")
             
@@ -734,8 +1253,10 @@ class PortfolioManager:
     def load_portfolio_state(self, filename: str):
         """Load portfolio state from file."""
         try:
-            with open(filename, 'r') as f:
-                state = json.load(f)
+            state = _read_state_file(filename)
+            # Read the log before touching anything, so a bad log leaves the
+            # current portfolio as it was
+            history_log = self._read_performance_history(filename)
             
             self.initial_capital = state['initial_capital']
             self.risk_tolerance = state.get('risk_tolerance', 'moderate')
@@ -746,32 +1267,83 @@ class PortfolioManager:
             self.portfolio.total_capital = portfolio_data['total_capital']
             self.portfolio.available_cash = portfolio_data['available_cash']
             self.portfolio.total_value = portfolio_data['total_value']
-            self.portfolio.created_at = datetime.fromisoformat(portfolio_data['created_at'])
+            fromisoformat = datetime.fromisoformat
+            self.portfolio.created_at = fromisoformat(portfolio_data['created_at'])
             
             if portfolio_data['last_rebalance']:
-                self.portfolio.last_rebalance = datetime.fromisoformat(portfolio_data['last_rebalance'])
+                self.portfolio.last_rebalance = fromisoformat(portfolio_data['last_rebalance'])
             
             # Reconstruct assets
-            self.portfolio.assets = {}
-            for symbol, asset_data in portfolio_data['assets'].items():
-                asset = Asset(
-                    symbol=asset_data['symbol'],
-                    name=asset_data['name'],
-                    asset_type=AssetType(asset_data['asset_type']),
-                    current_price=asset_data['current_price'],
-                    quantity=asset_data['quantity'],
-                    avg_cost=asset_data['avg_cost'],
-                    target_allocation=asset_data['target_allocation']
+            asset_class = Asset
+            asset_types = _ASSET_TYPES
+            self.portfolio.assets = {
+                # Positional in Asset field order: symbol, name, asset_type,
+                # current_price, quantity, avg_cost, target_allocation
+                symbol: asset_class(
+                    asset_data['symbol'],
+                    asset_data['name'],
+                    asset_types[asset_data['asset_type']],
+                    asset_data['current_price'],
+                    asset_data['quantity'],
+                    asset_data['avg_cost'],
+                    asset_data['target_allocation']
                 )
-                self.portfolio.assets[symbol] = asset
+                for symbol, asset_data in portfolio_data['assets'].items()
+            }
             
             self.performance_metrics = state.get('performance_metrics', self.performance_metrics)
+            if history_log is None:
+                self._history_log = None
+            else:
+                self.portfolio.performance_history, self._history_log = history_log
+                self._calculate_performance_metrics()
             
             logger.info(f"Portfolio state loaded from {filename}")
             
         except Exception as e:
             logger.error(f"Error loading portfolio state: {str(e)}")
 
+    def _save_performance_history(self, filename: str):
+        """
+        Persist performance history to the log beside a state file.
+        
+        Records are immutable once tracked, so repeated saves to the same file
+        only append the records added since the previous save. Returns the new
+        (log filename, records written) position; the caller stores it once the
+        state file is written too.
+        """
+        history = self.portfolio.performance_history
+        log_filename = _history_log_filename(filename)
+        
+        if self._history_log is not None and self._history_log[0] == log_filename:
+            start = self._history_log[1]
+        else:
+            start = 0
+        if start > len(history):
+            start = 0
+        
+        if start == 0 or start < len(history):
+            _write_history_records(log_filename, history[start:], append=start > 0)
+        return (log_filename, len(history))
+
+    def _read_performance_history(self, filename: str):
+        """
+        Read the performance log beside a state file.
+        
+        Returns (history, log position), or None if there is no log.
+        """
+        log_filename = _history_log_filename(filename)
+        if not os.path.exists(log_filename):
+            return None
+        
+        history = PerformanceHistory()
+        if _read_history_records(log_filename, history):
+            return history, (log_filename, len(history))
+        
+        logger.warning("Skipped a partial last record in %s", log_filename)
+        # No position, so the next save rewrites the log without the partial line
+        return history, None
+
     def get_recent_signals(self, limit: int = 10) -> List[Signal]:
         """Get recent trading signals."""
         return self.portfolio.signals_history[-limit:] if self.portfolio.signals_history else []
@@ -782,8 +1354,7 @@ class PortfolioManager:
             return []
         
         cutoff_date = datetime.now() - timedelta(days=days)
-        return [record for record in self.portfolio.performance_history 
-                if record['date'] >= cutoff_date]
+        return self.portfolio.performance_history.since(cutoff_date)
 
     def buy_stock(self, symbol: str, shares: int, price: float) -> bool:
         """Buy shares of a stock (public method for API)."""
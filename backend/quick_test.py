@@ -5,15 +5,14 @@ Quick Test Suite - Tests key functionality
 
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 def test_endpoint(url, name):
     """Test a single endpoint"""
     try:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         response = requests.get(url, timeout=30)
-        end_time = time.time()
-        
-        response_time = end_time - start_time
+        response_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         if response.status_code == 200:
             print(f"✅ {name}: {response.status_code} ({response_time:.2f}s)")
@@ -40,13 +39,12 @@ def main():
         ("https://ai-stock-trading-frontend-1024040140027.us-central1.run.app/", "Frontend"),
     ]
     
-    passed = 0
     total = len(tests)
     
-    for url, name in tests:
-        if test_endpoint(url, name):
-            passed += 1
-        time.sleep(0.5)
+    # The endpoints live on separate services, so probe them all at once
+    with ThreadPoolExecutor(max_workers=total) as executor:
+        results = list(executor.map(lambda test: test_endpoint(*test), tests))
+    passed = sum(results)
     
     print("\n" + "=" * 50)
     print(f"📊 Results: {passed}/{total} tests passed ({passed/total*100:.1f}%)")
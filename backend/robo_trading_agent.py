@@ -6,21 +6,42 @@ Supports stocks, crypto, and other day trading instruments.
 """
 
 import asyncio
-import json
+import itertools
+from collections import Counter
 import logging
+import sys
 import time
+import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
-import random
 import math
-from decimal import Decimal, ROUND_HALF_UP
+import numpy as np
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Signal labels by the codes TechnicalAnalyzer.get_signals_batch assigns
+_RSI_SIGNALS = ('neutral', 'oversold', 'overbought')
+_MA_SIGNALS = ('neutral', 'bullish', 'bearish')
+_OVERALL_SIGNALS = ('neutral', 'strong_buy', 'strong_sell', 'buy', 'sell')
+
+# Overall signals that open or close a position
+_BUY_SIGNALS = frozenset(('buy', 'strong_buy'))
+_SELL_SIGNALS = frozenset(('sell', 'strong_sell'))
+
+# Task/order id parts shared by every agent in the process: the counters keep
+# ids unique between agents, the random tag between processes
+_ID_PROCESS_TAG = uuid.uuid4().hex[:8]
+_TASK_SEQUENCE = itertools.count(1)
+_ORDER_SEQUENCE = itertools.count(1)
+
+# Slotted dataclasses drop the per-instance __dict__ (slots= needs Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 class TradingStatus(Enum):
     """Trading status enumeration."""
     IDLE = "idle"
@@ -51,7 +72,7 @@ class OrderSide(Enum):
     BUY = "buy"
     SELL = "sell"
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MarketData:
     """Market data structure."""
     symbol: str
@@ -65,7 +86,7 @@ class MarketData:
     change: float
     change_percent: float
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Order:
     """Order structure."""
     id: str
@@ -79,7 +100,7 @@ class Order:
     filled_quantity: float = 0.0
     average_price: float = 0.0
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Position:
     """Position structure."""
     symbol: str
@@ -90,7 +111,7 @@ class Position:
     realized_pnl: float
     timestamp: datetime
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TradingTask:
     """Trading task structure."""
     id: str
@@ -114,8 +135,11 @@ class TradingTask:
 class MarketDataProvider:
     """Mock market data provider for demonstration."""
     
+    DEFAULT_PRICE = 100.0
+    DEFAULT_VOLATILITY = 0.02
+    
     def __init__(self):
-        self.base_prices = {
+        base_prices = {
             'AAPL': 150.0,
             'TSLA': 245.0,
             'MSFT': 380.0,
@@ -127,7 +151,7 @@ class MarketDataProvider:
             'ADA': 0.45,
             'DOT': 6.8
         }
-        self.volatility = {
+        volatility = {
             'AAPL': 0.02,
             'TSLA': 0.05,
             'MSFT': 0.015,
@@ -139,79 +163,218 @@ class MarketDataProvider:
             'ADA': 0.08,
             'DOT': 0.045
         }
+        
+        # Prices and volatilities are kept in arrays indexed by symbol id so a
+        # whole batch of symbols can be simulated in one vectorized step
+        self._symbol_ids: Dict[str, int] = {symbol: i for i, symbol in enumerate(base_prices)}
+        self._prices = np.array([base_prices[symbol] for symbol in self._symbol_ids], dtype=np.float64)
+        self._volatility = np.array([volatility[symbol] for symbol in self._symbol_ids], dtype=np.float64)
+        self.rng = np.random.default_rng()
+    
+    # Read-only snapshots: the arrays are the source of truth, so writing through
+    # these views must fail loudly instead of silently editing a copy
+    @property
+    def base_prices(self) -> Mapping[str, float]:
+        return MappingProxyType(dict(zip(self._symbol_ids, self._prices.tolist())))
     
-    def get_market_data(self, symbol: str) -> MarketData:
+    @property
+    def volatility(self) -> Mapping[str, float]:
+        return MappingProxyType(dict(zip(self._symbol_ids, self._volatility.tolist())))
+    
+    def _symbol_id(self, symbol: str) -> int:
+        """Index of a symbol in the price arrays, registering unknown symbols with default values."""
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = self._symbol_ids[symbol] = len(self._prices)
+            self._prices = np.append(self._prices, self.DEFAULT_PRICE)
+            self._volatility = np.append(self._volatility, self.DEFAULT_VOLATILITY)
+        return symbol_id
+    
+    def get_market_data(self, symbol: str, timestamp: datetime = None) -> MarketData:
         """Get current market data for a symbol."""
-        base_price = self.base_prices.get(symbol, 100.0)
-        volatility = self.volatility.get(symbol, 0.02)
+        return self.get_market_data_batch([symbol], timestamp)[symbol]
+    
+    async def get_market_data_batch_async(self, symbols: List[str], timestamp: datetime = None) -> Dict[str, MarketData]:
+        """
+        Awaitable form of get_market_data_batch.
+        
+        The mock data is generated in-process; a live feed would await its
+        network fetch here.
+        """
+        return self.get_market_data_batch(symbols, timestamp)
+    
+    def get_market_data_batch(self, symbols: List[str], timestamp: datetime = None) -> Dict[str, MarketData]:
+        """
+        Get current market data for several symbols, simulating their moves together.
         
-        # Simulate price movement
-        change_percent = random.uniform(-volatility, volatility)
-        current_price = base_price * (1 + change_percent)
+        The quotes are stamped with `timestamp`, or the current time if not given.
+        A symbol listed more than once is moved and quoted once.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        ids = np.fromiter((self._symbol_id(symbol) for symbol in symbols), dtype=np.intp, count=len(symbols))
         
-        # Update base price for next iteration
-        self.base_prices[symbol] = current_price
+        # Simulate price movement
+        base_prices = self._prices[ids]
+        change_percents = self.rng.uniform(-self._volatility[ids], self._volatility[ids])
+        current_prices = base_prices * (1 + change_percents)
+        volumes = self.rng.uniform(1000000, 10000000, len(ids))
         
-        bid = current_price * 0.999
-        ask = current_price * 1.001
+        # Update base prices for next iteration
+        self._prices[ids] = current_prices
         
-        return MarketData(
-            symbol=symbol,
-            price=current_price,
-            volume=random.uniform(1000000, 10000000),
-            timestamp=datetime.now(),
-            bid=bid,
-            ask=ask,
-            high=current_price * 1.02,
-            low=current_price * 0.98,
-            change=current_price - base_price,
-            change_percent=change_percent * 100
-        )
+        if timestamp is None:
+            timestamp = datetime.now()
+        return {
+            symbol: MarketData(
+                symbol=symbol,
+                price=current_price,
+                volume=volume,
+                timestamp=timestamp,
+                bid=current_price * 0.999,
+                ask=current_price * 1.001,
+                high=current_price * 1.02,
+                low=current_price * 0.98,
+                change=current_price - base_price,
+                change_percent=change_percent * 100
+            )
+            for symbol, current_price, base_price, change_percent, volume in zip(
+                symbols, current_prices.tolist(), base_prices.tolist(),
+                change_percents.tolist(), volumes.tolist()
+            )
+        }
+
+class PriceHistory:
+    """
+    Fixed-capacity ring buffer of the most recent prices for one symbol.
+    
+    Rolling sums for the default SMA windows and the RSI gain/loss window are
+    updated on every append, so those indicators are O(1) to read. All windows
+    must be shorter than the capacity.
+    """
+    
+    def __init__(self, capacity: int = 100, sma_periods: Tuple[int, ...] = (20, 50), rsi_period: int = 14):
+        self.capacity = capacity
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._head = 0  # Total prices ever appended; the next write goes to head % capacity
+        self.last_timestamp = None
+        
+        self._price_sums = {period: 0.0 for period in sma_periods}
+        self.rsi_period = rsi_period
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        # Number of gains/losses in the RSI window, so an empty side reads as exactly zero
+        self._gain_count = 0
+        self._loss_count = 0
+    
+    def append(self, price: float, timestamp: datetime = None):
+        """Add a price, overwriting the oldest one once the buffer is full."""
+        prices = self._prices
+        capacity = self.capacity
+        head = self._head
+        
+        for period in self._price_sums:
+            self._price_sums[period] += price
+            if head >= period:
+                self._price_sums[period] -= prices.item((head - period) % capacity)
+        
+        if head:
+            self._add_change(price - prices.item((head - 1) % capacity), 1)
+            if head > self.rsi_period:
+                # Drop the change that just left the RSI window
+                start = head - self.rsi_period
+                self._add_change(prices.item(start % capacity) - prices.item((start - 1) % capacity), -1)
+        
+        prices[head % capacity] = price
+        self._head = head + 1
+        self.last_timestamp = timestamp
+        
+        # Recompute the sums from the buffer once per wrap so rounding error can't accumulate
+        if self._head % capacity == 0:
+            self._resync_sums()
+    
+    def _resync_sums(self):
+        """Recompute the rolling sums exactly from the buffered prices."""
+        count = len(self)
+        for period in self._price_sums:
+            if count >= period:
+                self._price_sums[period] = float(self.last(period).sum())
+        
+        changes = np.diff(self.last(min(count, self.rsi_period + 1)))
+        gains = changes[changes > 0]
+        losses = changes[changes < 0]
+        self._gain_sum = float(gains.sum())
+        self._loss_sum = float(-losses.sum())
+        self._gain_count = len(gains)
+        self._loss_count = len(losses)
+    
+    def _add_change(self, change: float, sign: int):
+        """Add (sign=1) or remove (sign=-1) a price change from the RSI sums."""
+        if change > 0:
+            self._gain_sum += sign * change
+            self._gain_count += sign
+        elif change < 0:
+            self._loss_sum -= sign * change
+            self._loss_count += sign
+    
+    def moving_sum(self, period: int) -> Optional[float]:
+        """Sum of the last `period` prices, if that window is tracked."""
+        return self._price_sums.get(period)
+    
+    def rsi_sums(self) -> Tuple[float, float]:
+        """Total gain and total loss over the last `rsi_period` price changes."""
+        return (self._gain_sum if self._gain_count else 0.0,
+                self._loss_sum if self._loss_count else 0.0)
+    
+    def __len__(self) -> int:
+        return min(self._head, self.capacity)
+    
+    @property
+    def head(self) -> int:
+        """Total number of prices appended; changes on every tick."""
+        return self._head
+    
+    @property
+    def latest(self) -> float:
+        return float(self._prices[(self._head - 1) % self.capacity])
+    
+    def last(self, n: int) -> np.ndarray:
+        """Return the n most recent prices, oldest first."""
+        end = self._head % self.capacity
+        start = end - n
+        if start >= 0:
+            return self._prices[start:end]
+        # Window wraps around the end of the buffer
+        return np.concatenate((self._prices[start:], self._prices[:end]))
 
 class TechnicalAnalyzer:
     """Technical analysis component."""
     
     def __init__(self):
-        self.price_history = {}
-        self.indicators = {}
+        self.price_history: Dict[str, PriceHistory] = {}
+        self.indicators = {}  # symbol -> (price history head, signals) of the last evaluation
     
     def add_price_data(self, symbol: str, price: float, timestamp: datetime):
-        """Add price data to history."""
-        if symbol not in self.price_history:
-            self.price_history[symbol] = []
+        """Add price data to history (the last 100 data points are kept)."""
+        history = self.price_history.get(symbol)
+        if history is None:
+            history = self.price_history[symbol] = PriceHistory(100)
         
-        self.price_history[symbol].append({
-            'price': price,
-            'timestamp': timestamp
-        })
-        
-        # Keep only last 100 data points
-        if len(self.price_history[symbol]) > 100:
-            self.price_history[symbol] = self.price_history[symbol][-100:]
+        history.append(price, timestamp)
     
     def calculate_rsi(self, symbol: str, period: int = 14) -> Optional[float]:
         """Calculate RSI indicator."""
-        if symbol not in self.price_history or len(self.price_history[symbol]) < period + 1:
+        history = self.price_history.get(symbol)
+        if history is None or len(history) < period + 1:
             return None
         
-        prices = [p['price'] for p in self.price_history[symbol][-period-1:]]
-        gains = []
-        losses = []
-        
-        for i in range(1, len(prices)):
-            change = prices[i] - prices[i-1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-        
-        if not gains or not losses:
-            return 50.0
-        
-        avg_gain = sum(gains) / len(gains)
-        avg_loss = sum(losses) / len(losses)
+        if period == history.rsi_period:
+            gain_sum, loss_sum = history.rsi_sums()
+        else:
+            changes = np.diff(history.last(period + 1))
+            gain_sum = float(np.maximum(changes, 0.0).sum())
+            loss_sum = float(-np.minimum(changes, 0.0).sum())
+        avg_gain = gain_sum / period
+        avg_loss = loss_sum / period
         
         if avg_loss == 0:
             return 100.0
@@ -223,19 +386,92 @@ class TechnicalAnalyzer:
     
     def calculate_moving_average(self, symbol: str, period: int = 20) -> Optional[float]:
         """Calculate simple moving average."""
-        if symbol not in self.price_history or len(self.price_history[symbol]) < period:
+        history = self.price_history.get(symbol)
+        if history is None or len(history) < period:
             return None
         
-        prices = [p['price'] for p in self.price_history[symbol][-period:]]
-        return sum(prices) / len(prices)
+        price_sum = history.moving_sum(period)
+        if price_sum is None:
+            return float(history.last(period).mean())
+        return price_sum / period
     
     def get_trading_signals(self, symbol: str) -> Dict[str, Any]:
-        """Get trading signals based on technical indicators."""
+        """Get trading signals based on technical indicators, reused until the next price tick."""
+        history = self.price_history.get(symbol)
+        if history is None:
+            return self._compute_trading_signals(symbol)
+        
+        cached = self.indicators.get(symbol)
+        if cached is None or cached[0] != history.head:
+            cached = self.indicators[symbol] = (history.head, self._compute_trading_signals(symbol))
+        
+        # Hand out a copy so callers can't alter the cached signals
+        return dict(cached[1])
+    
+    def get_signals_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get trading signals for several symbols at once.
+        
+        Gives the same result as calling get_trading_signals for each symbol,
+        but evaluates the indicators and the signal rules as arrays.
+        """
+        histories = [self.price_history.get(symbol) for symbol in symbols]
+        counts = np.array([len(history) if history else 0 for history in histories])
+        prices = np.array([history.latest if history else np.nan for history in histories])
+        rsi_sums = np.array([history.rsi_sums() if history else (0.0, 0.0) for history in histories]).reshape(-1, 2)
+        sma_sums = np.array([
+            (history.moving_sum(20), history.moving_sum(50)) if history else (0.0, 0.0)
+            for history in histories
+        ], dtype=np.float64).reshape(-1, 2)
+        
+        # Indicators, NaN where there isn't enough history (None in the scalar path)
+        avg_gain = rsi_sums[:, 0] / 14
+        avg_loss = rsi_sums[:, 1] / 14
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = np.where(avg_loss == 0, 100.0, 100 - (100 / (1 + avg_gain / avg_loss)))
+        rsi[counts < 15] = np.nan
+        sma_20 = np.where(counts >= 20, sma_sums[:, 0] / 20, np.nan)
+        sma_50 = np.where(counts >= 50, sma_sums[:, 1] / 50, np.nan)
+        
+        # Signal rules; comparisons with NaN are false, leaving those signals neutral
+        oversold = rsi < 30
+        overbought = rsi > 70
+        bullish = (prices > sma_20) & (sma_20 > sma_50)
+        bearish = (prices < sma_20) & (sma_20 < sma_50)
+        rsi_codes = np.select([oversold, overbought], [1, 2], 0)
+        ma_codes = np.select([bullish, bearish], [1, 2], 0)
+        overall_codes = np.select(
+            [oversold & bullish, overbought & bearish, oversold | bullish, overbought | bearish],
+            [1, 2, 3, 4], 0
+        )
+        
+        results = {}
+        for symbol, history, rsi_value, sma_20_value, sma_50_value, price, rsi_code, ma_code, overall_code in zip(
+            symbols, histories, rsi.tolist(), sma_20.tolist(), sma_50.tolist(), prices.tolist(),
+            rsi_codes.tolist(), ma_codes.tolist(), overall_codes.tolist()
+        ):
+            signals = {
+                'rsi': None if math.isnan(rsi_value) else rsi_value,
+                'sma_20': None if math.isnan(sma_20_value) else sma_20_value,
+                'sma_50': None if math.isnan(sma_50_value) else sma_50_value,
+                'current_price': None if history is None else price,
+                'rsi_signal': _RSI_SIGNALS[rsi_code],
+                'ma_signal': _MA_SIGNALS[ma_code],
+                'overall_signal': _OVERALL_SIGNALS[overall_code]
+            }
+            if history is not None:
+                self.indicators[symbol] = (history.head, signals)
+            results[symbol] = dict(signals)
+        
+        return results
+    
+    def _compute_trading_signals(self, symbol: str) -> Dict[str, Any]:
+        """Evaluate the indicators and derive signals for the current price history."""
         rsi = self.calculate_rsi(symbol)
         sma_20 = self.calculate_moving_average(symbol, 20)
         sma_50 = self.calculate_moving_average(symbol, 50)
         
-        current_price = self.price_history[symbol][-1]['price'] if symbol in self.price_history else None
+        current_price = self.price_history[symbol].latest if symbol in self.price_history else None
         
         signals = {
             'rsi': rsi,
@@ -275,9 +511,139 @@ class TechnicalAnalyzer:
         
         return signals
 
+class TradeLog:
+    """
+    Columnar, append-only log of executed trades.
+    
+    Numeric fields live in NumPy columns that double when full, so per-task
+    report totals are array reductions. Fields that are not numeric (order id,
+    symbol, exit reason, entry signals) are kept in plain lists. Records are
+    rebuilt as the original trade dicts on access.
+    """
+    
+    _SIDES = ('buy', 'sell')
+    _SIDE_CODES = {side: code for code, side in enumerate(_SIDES)}
+    
+    def __init__(self):
+        self._count = 0
+        self._task_ids: List[str] = []  # Interned task ids; the task column holds their index
+        self._task_codes: Dict[str, int] = {}
+        self._order_ids: List[str] = []
+        self._symbols: List[str] = []
+        self._exit_reasons: List[Optional[str]] = []
+        self._signals: List[Optional[Dict]] = []
+        self._allocate(64)
+    
+    def _allocate(self, size: int):
+        """Allocate (or grow) the numeric columns to hold `size` trades."""
+        columns = {
+            '_task': np.empty(size, dtype=np.int32),
+            '_side': np.empty(size, dtype=np.int8),
+            '_quantity': np.empty(size, dtype=np.float64),
+            '_price': np.empty(size, dtype=np.float64),
+            '_value': np.empty(size, dtype=np.float64),
+            '_commission': np.empty(size, dtype=np.float64),
+            '_pnl': np.empty(size, dtype=np.float64),  # NaN for buys
+            '_timestamps': np.empty(size, dtype='datetime64[us]')
+        }
+        for name, column in columns.items():
+            if self._count:
+                column[:self._count] = getattr(self, name)[:self._count]
+            setattr(self, name, column)
+    
+    def append(self, trade: Dict):
+        """Record a trade given as a trade log dict."""
+        if self._count == len(self._side):
+            self._allocate(self._count * 2)
+        
+        task_code = self._task_codes.get(trade['task_id'])
+        if task_code is None:
+            task_code = self._task_codes[trade['task_id']] = len(self._task_ids)
+            self._task_ids.append(trade['task_id'])
+        
+        i = self._count
+        self._task[i] = task_code
+        self._side[i] = self._SIDE_CODES[trade['side']]
+        self._quantity[i] = trade['quantity']
+        self._price[i] = trade['price']
+        self._value[i] = trade['value']
+        self._commission[i] = trade['commission']
+        self._pnl[i] = trade.get('pnl', np.nan)
+        self._timestamps[i] = trade['timestamp']
+        self._order_ids.append(trade['order_id'])
+        self._symbols.append(trade['symbol'])
+        self._exit_reasons.append(trade.get('exit_reason'))
+        self._signals.append(trade.get('signals'))
+        self._count += 1
+    
+    def rows_for_task(self, task_id: str) -> np.ndarray:
+        """Row indices of a task's trades, in execution order."""
+        task_code = self._task_codes.get(task_id)
+        if task_code is None:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(self._task[:self._count] == task_code)
+    
+    def side_counts(self, rows: np.ndarray) -> Tuple[int, int]:
+        """Number of buys and sells among the given rows."""
+        sells = int(np.count_nonzero(self._side[rows]))
+        return len(rows) - sells, sells
+    
+    def total(self, field: str, rows: np.ndarray) -> float:
+        """Sum of a numeric field ('value' or 'commission') over the given rows."""
+        return float(getattr(self, '_' + field)[rows].sum())
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __getitem__(self, key):
+        positions = range(self._count)[key]
+        if isinstance(key, slice):
+            return self.records(np.asarray(positions, dtype=np.intp))
+        return self.records(np.array([positions]))[0]
+    
+    def __iter__(self):
+        return iter(self[:])
+    
+    def records(self, rows: np.ndarray) -> List[Dict]:
+        """Rebuild the trade log dicts for the given rows."""
+        trades = []
+        for row, side, quantity, price, value, commission, pnl, timestamp in zip(
+            rows.tolist(), self._side[rows].tolist(), self._quantity[rows].tolist(),
+            self._price[rows].tolist(), self._value[rows].tolist(),
+            self._commission[rows].tolist(), self._pnl[rows].tolist(),
+            self._timestamps[rows].tolist()
+        ):
+            trade = {
+                'task_id': self._task_ids[self._task[row]],
+                'order_id': self._order_ids[row],
+                'symbol': self._symbols[row],
+                'side': self._SIDES[side],
+                'quantity': quantity,
+                'price': price,
+                'value': value,
+                'commission': commission
+            }
+            # Same keys, in the same order, as the buy/sell trade log dicts
+            if side:
+                trade['pnl'] = pnl
+                trade['exit_reason'] = self._exit_reasons[row]
+                trade['timestamp'] = timestamp
+            else:
+                trade['timestamp'] = timestamp
+                trade['signals'] = self._signals[row]
+            trades.append(trade)
+        return trades
+
 class RoboTradingAgent:
     """Main robo trading agent class."""
     
+    # risk tolerance -> (max position as a fraction of capital, stop loss %, take profit %)
+    RISK_PROFILES = {
+        'low': (0.1, 2.0, 3.0),
+        'medium': (0.25, 3.0, 5.0),
+        'high': (0.5, 5.0, 8.0)
+    }
+    
     def __init__(self, name: str = "RoboTrader"):
         self.name = name
         self.market_data_provider = MarketDataProvider()
@@ -287,7 +653,12 @@ class RoboTradingAgent:
         self.tasks: Dict[str, TradingTask] = {}
         self.positions: Dict[str, Position] = {}
         self.orders: Dict[str, Order] = {}
-        self.trade_history: List[Dict] = []
+        self.trade_history = TradeLog()
+        # Ids are the agent's start time, the process tag and a process-wide counter
+        self._id_prefix = f"{int(time.time())}_{_ID_PROCESS_TAG}"
+        
+        # task id -> asdict(task), dropped whenever the agent changes the task
+        self._task_snapshots: Dict[str, Dict] = {}
         
         # Configuration
         self.max_concurrent_tasks = 5
@@ -300,6 +671,11 @@ class RoboTradingAgent:
         self.successful_trades = 0
         self.total_pnl = 0.0
         
+        # Running totals over all tasks, updated by the methods that change them
+        self._total_initial_capital = 0.0
+        self._total_balance = 0.0
+        self._status_counts: Counter = Counter()
+        
         logger.info(f"🤖 {self.name} initialized successfully")
     
     def create_trading_task(self, 
@@ -314,25 +690,21 @@ class RoboTradingAgent:
         if len(self.tasks) >= self.max_concurrent_tasks:
             raise ValueError("Maximum number of concurrent tasks reached")
         
-        task_id = f"task_{int(time.time())}_{random.randint(1000, 9999)}"
+        task_id = f"task_{self._id_prefix}_{next(_TASK_SEQUENCE)}"
         start_time = datetime.now()
         end_time = start_time + timedelta(hours=duration_hours)
         
         target_profit_percent = ((target_amount - initial_capital) / initial_capital) * 100
         
-        # Calculate position sizing based on risk tolerance
-        if risk_tolerance == "low":
-            max_position_size = initial_capital * 0.1
-            stop_loss_percent = 2.0
-            take_profit_percent = 3.0
-        elif risk_tolerance == "high":
-            max_position_size = initial_capital * 0.5
-            stop_loss_percent = 5.0
-            take_profit_percent = 8.0
-        else:  # medium
-            max_position_size = initial_capital * 0.25
-            stop_loss_percent = 3.0
-            take_profit_percent = 5.0
+        # Intern symbols (often parsed from user input) so every task, position and
+        # price history keyed by the same symbol shares one string object, and the
+        # per-cycle dict lookups match on identity instead of comparing characters
+        symbols = [sys.intern(symbol) for symbol in symbols]
+        
+        # Calculate position sizing based on risk tolerance (unknown values get medium)
+        position_fraction, stop_loss_percent, take_profit_percent = self.RISK_PROFILES.get(
+            risk_tolerance, self.RISK_PROFILES['medium'])
+        max_position_size = initial_capital * position_fraction
         
         task = TradingTask(
             id=task_id,
@@ -355,6 +727,9 @@ class RoboTradingAgent:
         )
         
         self.tasks[task_id] = task
+        self._total_initial_capital += initial_capital
+        self._total_balance += initial_capital
+        self._status_counts[task.status] += 1
         logger.info(f"📋 Created trading task {task_id}: ${initial_capital} → ${target_amount} ({target_profit_percent:.1f}%)")
         
         return task_id
@@ -365,7 +740,7 @@ class RoboTradingAgent:
             raise ValueError(f"Task {task_id} not found")
         
         task = self.tasks[task_id]
-        task.status = TradingStatus.MONITORING
+        self._set_task_status(task_id, TradingStatus.MONITORING)
         
         logger.info(f"🚀 Started trading task {task_id}")
         logger.info(f"💰 Target: ${task.initial_capital} → ${task.target_amount}")
@@ -378,7 +753,7 @@ class RoboTradingAgent:
             raise ValueError(f"Task {task_id} not found")
         
         task = self.tasks[task_id]
-        task.status = TradingStatus.STOPPED
+        self._set_task_status(task_id, TradingStatus.STOPPED)
         
         # Close all positions
         for symbol in list(self.positions.keys()):
@@ -387,6 +762,14 @@ class RoboTradingAgent:
         
         logger.info(f"🛑 Stopped trading task {task_id}")
     
+    def _set_task_status(self, task_id: str, status: TradingStatus):
+        """Change a task's status, keeping the status counts and snapshot cache current."""
+        task = self.tasks[task_id]
+        self._status_counts[task.status] -= 1
+        self._status_counts[status] += 1
+        task.status = status
+        self._task_snapshots.pop(task_id, None)
+    
     def get_task_status(self, task_id: str) -> Optional[TradingTask]:
         """Get task status."""
         return self.tasks.get(task_id)
@@ -397,39 +780,95 @@ class RoboTradingAgent:
     
     def execute_trading_cycle(self, task_id: str):
         """Execute one trading cycle for a task."""
-        if task_id not in self.tasks:
+        now = self._begin_trading_cycle(task_id)
+        if now is None:
             return
         
+        # Fetch market data for every symbol at once, then analyze each symbol
         task = self.tasks[task_id]
+        market_data = self.market_data_provider.get_market_data_batch(task.symbols, now)
+        self._trade_symbols(task_id, market_data)
+    
+    async def execute_trading_cycle_async(self, task_id: str):
+        """Execute one trading cycle for a task, awaiting the market data fetch."""
+        now = self._begin_trading_cycle(task_id)
+        if now is None:
+            return
         
+        task = self.tasks[task_id]
+        market_data = await self.market_data_provider.get_market_data_batch_async(task.symbols, now)
+        
+        # The task may have been stopped while the fetch was pending
         if task.status != TradingStatus.MONITORING:
             return
         
+        # Analysis and order execution don't await, so they never interleave with other tasks
+        self._trade_symbols(task_id, market_data)
+    
+    async def execute_trading_cycles(self, task_ids: List[str]):
+        """Execute one trading cycle for several tasks concurrently."""
+        await asyncio.gather(*(self.execute_trading_cycle_async(task_id) for task_id in task_ids))
+    
+    def _begin_trading_cycle(self, task_id: str) -> Optional[datetime]:
+        """
+        Check whether a task should trade this cycle, updating its status if not.
+        
+        Returns the cycle timestamp, or None if the task should not trade.
+        """
+        if task_id not in self.tasks:
+            return None
+        
+        task = self.tasks[task_id]
+        
+        if task.status != TradingStatus.MONITORING:
+            return None
+        
         # Check if target reached
         if task.current_balance >= task.target_amount:
-            task.status = TradingStatus.TARGET_REACHED
+            self._set_task_status(task_id, TradingStatus.TARGET_REACHED)
             logger.info(f"🎯 Target reached for task {task_id}: ${task.current_balance:.2f}")
-            return
+            return None
+        
+        # One clock reading per cycle; quotes, orders and trade logs all carry it
+        now = datetime.now()
         
         # Check if time expired
-        if datetime.now() > task.end_time:
-            task.status = TradingStatus.STOPPED
+        if now > task.end_time:
+            self._set_task_status(task_id, TradingStatus.STOPPED)
             logger.info(f"⏰ Time expired for task {task_id}")
+            return None
+        
+        return now
+    
+    def _trade_symbols(self, task_id: str, market_data: Dict[str, MarketData]):
+        """Analyze and trade each of a task's symbols against fetched market data."""
+        # Record every symbol's tick, then evaluate all of their signals in one batch
+        recorded = []
+        for symbol, data in market_data.items():
+            try:
+                self.technical_analyzer.add_price_data(symbol, data.price, data.timestamp)
+                recorded.append(symbol)
+            except Exception as e:
+                logger.error(f"Error analyzing {symbol}: {e}")
+        
+        try:
+            signals = self.technical_analyzer.get_signals_batch(recorded)
+        except Exception as e:
+            logger.error(f"Error analyzing {', '.join(recorded)}: {e}")
             return
         
-        # Analyze each symbol
-        for symbol in task.symbols:
+        for symbol in recorded:
+            data = market_data[symbol]
             try:
-                self._analyze_and_trade(symbol, task_id)
+                self._act_on_signals(symbol, task_id, data, signals[symbol])
             except Exception as e:
                 logger.error(f"Error analyzing {symbol}: {e}")
     
-    def _analyze_and_trade(self, symbol: str, task_id: str):
+    def _analyze_and_trade(self, symbol: str, task_id: str, market_data: MarketData = None):
         """Analyze market data and execute trades."""
-        task = self.tasks[task_id]
-        
         # Get market data
-        market_data = self.market_data_provider.get_market_data(symbol)
+        if market_data is None:
+            market_data = self.market_data_provider.get_market_data(symbol)
         
         # Add to technical analyzer
         self.technical_analyzer.add_price_data(symbol, market_data.price, market_data.timestamp)
@@ -437,17 +876,21 @@ class RoboTradingAgent:
         # Get technical signals
         signals = self.technical_analyzer.get_trading_signals(symbol)
         
+        self._act_on_signals(symbol, task_id, market_data, signals)
+    
+    def _act_on_signals(self, symbol: str, task_id: str, market_data: MarketData, signals: Dict):
+        """Open or exit a position based on a symbol's technical signals."""
         # Check current position
         current_position = self.positions.get(symbol)
         
         # Decision making logic
         if current_position is None:
             # No position - look for entry
-            if signals['overall_signal'] in ['buy', 'strong_buy']:
+            if signals['overall_signal'] in _BUY_SIGNALS:
                 self._execute_buy_order(symbol, task_id, market_data, signals)
         else:
             # Have position - check exit conditions
-            self._check_exit_conditions(symbol, task_id, market_data, signals)
+            self._check_exit_conditions(symbol, task_id, market_data, signals, current_position)
     
     def _execute_buy_order(self, symbol: str, task_id: str, market_data: MarketData, signals: Dict):
         """Execute a buy order."""
@@ -461,25 +904,26 @@ class RoboTradingAgent:
             return
         
         # Calculate quantity
-        quantity = max_position_value / market_data.price
+        price = market_data.price
+        quantity = max_position_value / price
         quantity = round(quantity, 6)  # Round to 6 decimal places
         
         if quantity <= 0:
             return
         
         # Create order
-        order_id = f"order_{int(time.time())}_{random.randint(1000, 9999)}"
+        order_id = f"order_{self._id_prefix}_{next(_ORDER_SEQUENCE)}"
         order = Order(
             id=order_id,
             symbol=symbol,
             side=OrderSide.BUY,
             order_type=OrderType.MARKET,
             quantity=quantity,
-            price=market_data.price,
-            timestamp=datetime.now(),
+            price=price,
+            timestamp=market_data.timestamp,
             status="filled",
             filled_quantity=quantity,
-            average_price=market_data.price
+            average_price=price
         )
         
         # Execute order
@@ -489,17 +933,19 @@ class RoboTradingAgent:
         if total_cost <= task.current_balance:
             # Update task balance
             task.current_balance -= total_cost
+            self._total_balance -= total_cost
             task.trades_count += 1
+            self._task_snapshots.pop(task_id, None)
             
             # Create position
             position = Position(
                 symbol=symbol,
                 quantity=quantity,
-                average_price=market_data.price,
-                current_value=quantity * market_data.price,
+                average_price=price,
+                current_value=quantity * price,
                 unrealized_pnl=0.0,
                 realized_pnl=0.0,
-                timestamp=datetime.now()
+                timestamp=market_data.timestamp
             )
             
             self.positions[symbol] = position
@@ -512,88 +958,85 @@ class RoboTradingAgent:
                 'symbol': symbol,
                 'side': 'buy',
                 'quantity': quantity,
-                'price': market_data.price,
+                'price': price,
                 'value': max_position_value,
                 'commission': commission,
-                'timestamp': datetime.now(),
+                'timestamp': market_data.timestamp,
                 'signals': signals
             }
             self.trade_history.append(trade_log)
             
-            logger.info(f"📈 BUY {symbol}: {quantity:.6f} @ ${market_data.price:.2f} (${max_position_value:.2f})")
+            logger.info(f"📈 BUY {symbol}: {quantity:.6f} @ ${price:.2f} (${max_position_value:.2f})")
             logger.info(f"💰 Task {task_id} balance: ${task.current_balance:.2f}")
     
-    def _check_exit_conditions(self, symbol: str, task_id: str, market_data: MarketData, signals: Dict):
+    def _check_exit_conditions(self, symbol: str, task_id: str, market_data: MarketData, signals: Dict,
+                               position: Position = None):
         """Check exit conditions for existing position."""
         task = self.tasks[task_id]
-        position = self.positions[symbol]
+        if position is None:
+            position = self.positions[symbol]
         
         # Calculate current P&L
-        current_value = position.quantity * market_data.price
-        unrealized_pnl = current_value - (position.quantity * position.average_price)
-        unrealized_pnl_percent = (unrealized_pnl / (position.quantity * position.average_price)) * 100
+        quantity = position.quantity
+        cost_basis = quantity * position.average_price
+        current_value = quantity * market_data.price
+        unrealized_pnl = current_value - cost_basis
+        unrealized_pnl_percent = (unrealized_pnl / cost_basis) * 100
         
         # Update position
         position.current_value = current_value
         position.unrealized_pnl = unrealized_pnl
         
-        # Check exit conditions
-        should_exit = False
-        exit_reason = ""
-        
-        # Take profit
+        # Check exit conditions, first match wins
         if unrealized_pnl_percent >= task.take_profit_percent:
-            should_exit = True
             exit_reason = "take_profit"
-        
-        # Stop loss
         elif unrealized_pnl_percent <= -task.stop_loss_percent:
-            should_exit = True
             exit_reason = "stop_loss"
-        
-        # Technical signal
-        elif signals['overall_signal'] in ['sell', 'strong_sell']:
-            should_exit = True
+        elif signals['overall_signal'] in _SELL_SIGNALS:
             exit_reason = "technical_signal"
-        
-        # Target reached
         elif task.current_balance + current_value >= task.target_amount:
-            should_exit = True
             exit_reason = "target_reached"
+        else:
+            return
         
-        if should_exit:
-            self._execute_sell_order(symbol, task_id, market_data, exit_reason)
+        self._execute_sell_order(symbol, task_id, market_data, exit_reason, task, position)
     
-    def _execute_sell_order(self, symbol: str, task_id: str, market_data: MarketData, exit_reason: str):
+    def _execute_sell_order(self, symbol: str, task_id: str, market_data: MarketData, exit_reason: str,
+                            task: TradingTask = None, position: Position = None):
         """Execute a sell order."""
-        task = self.tasks[task_id]
-        position = self.positions[symbol]
+        if task is None:
+            task = self.tasks[task_id]
+        if position is None:
+            position = self.positions[symbol]
+        quantity = position.quantity
+        price = market_data.price
         
         # Create order
-        order_id = f"order_{int(time.time())}_{random.randint(1000, 9999)}"
+        order_id = f"order_{self._id_prefix}_{next(_ORDER_SEQUENCE)}"
         order = Order(
             id=order_id,
             symbol=symbol,
             side=OrderSide.SELL,
             order_type=OrderType.MARKET,
-            quantity=position.quantity,
-            price=market_data.price,
-            timestamp=datetime.now(),
+            quantity=quantity,
+            price=price,
+            timestamp=market_data.timestamp,
             status="filled",
-            filled_quantity=position.quantity,
-            average_price=market_data.price
+            filled_quantity=quantity,
+            average_price=price
         )
         
         # Calculate proceeds
-        gross_proceeds = position.quantity * market_data.price
+        gross_proceeds = quantity * price
         commission = gross_proceeds * self.default_commission
         net_proceeds = gross_proceeds - commission
         
         # Calculate P&L
-        realized_pnl = net_proceeds - (position.quantity * position.average_price)
+        realized_pnl = net_proceeds - (quantity * position.average_price)
         
         # Update task
         task.current_balance += net_proceeds
+        self._total_balance += net_proceeds
         task.total_pnl += realized_pnl
         task.trades_count += 1
         
@@ -602,6 +1045,7 @@ class RoboTradingAgent:
             self.successful_trades += 1
         self.total_trades += 1
         task.success_rate = (self.successful_trades / self.total_trades) * 100 if self.total_trades > 0 else 0
+        self._task_snapshots.pop(task_id, None)
         
         # Remove position
         del self.positions[symbol]
@@ -613,17 +1057,17 @@ class RoboTradingAgent:
             'order_id': order_id,
             'symbol': symbol,
             'side': 'sell',
-            'quantity': position.quantity,
-            'price': market_data.price,
+            'quantity': quantity,
+            'price': price,
             'value': gross_proceeds,
             'commission': commission,
             'pnl': realized_pnl,
             'exit_reason': exit_reason,
-            'timestamp': datetime.now()
+            'timestamp': market_data.timestamp
         }
         self.trade_history.append(trade_log)
         
-        logger.info(f"📉 SELL {symbol}: {position.quantity:.6f} @ ${market_data.price:.2f} (${gross_proceeds:.2f})")
+        logger.info(f"📉 SELL {symbol}: {quantity:.6f} @ ${price:.2f} (${gross_proceeds:.2f})")
         logger.info(f"💰 P&L: ${realized_pnl:.2f} | Task balance: ${task.current_balance:.2f}")
         logger.info(f"🎯 Exit reason: {exit_reason}")
     
@@ -637,14 +1081,14 @@ class RoboTradingAgent:
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get overall performance summary."""
-        total_initial_capital = sum(task.initial_capital for task in self.tasks.values())
-        total_current_balance = sum(task.current_balance for task in self.tasks.values())
+        total_initial_capital = self._total_initial_capital
+        total_current_balance = self._total_balance
         total_pnl = total_current_balance - total_initial_capital
         
         return {
             'total_tasks': len(self.tasks),
-            'active_tasks': len([t for t in self.tasks.values() if t.status == TradingStatus.MONITORING]),
-            'completed_tasks': len([t for t in self.tasks.values() if t.status in [TradingStatus.TARGET_REACHED, TradingStatus.STOPPED]]),
+            'active_tasks': self._status_counts[TradingStatus.MONITORING],
+            'completed_tasks': self._status_counts[TradingStatus.TARGET_REACHED] + self._status_counts[TradingStatus.STOPPED],
             'total_initial_capital': total_initial_capital,
             'total_current_balance': total_current_balance,
             'total_pnl': total_pnl,
@@ -662,18 +1106,23 @@ class RoboTradingAgent:
             return {}
         
         task = self.tasks[task_id]
-        task_trades = [t for t in self.trade_history if t['task_id'] == task_id]
+        rows = self.trade_history.rows_for_task(task_id)
+        buy_trades, sell_trades = self.trade_history.side_counts(rows)
+        
+        task_info = self._task_snapshots.get(task_id)
+        if task_info is None:
+            task_info = self._task_snapshots[task_id] = asdict(task)
         
         return {
-            'task_info': asdict(task),
-            'trades': task_trades,
+            'task_info': dict(task_info, symbols=list(task_info['symbols'])),
+            'trades': self.trade_history.records(rows),
             'current_positions': [asdict(p) for p in self.positions.values() if p.symbol in task.symbols],
             'performance_metrics': {
-                'total_trades': len(task_trades),
-                'buy_trades': len([t for t in task_trades if t['side'] == 'buy']),
-                'sell_trades': len([t for t in task_trades if t['side'] == 'sell']),
-                'total_commission': sum(t.get('commission', 0) for t in task_trades),
-                'avg_trade_size': sum(t.get('value', 0) for t in task_trades) / len(task_trades) if task_trades else 0
+                'total_trades': len(rows),
+                'buy_trades': buy_trades,
+                'sell_trades': sell_trades,
+                'total_commission': self.trade_history.total('commission', rows),
+                'avg_trade_size': self.trade_history.total('value', rows) / len(rows) if len(rows) else 0
             }
         }
 
@@ -725,8 +1174,7 @@ async def demonstrate_robo_trading():
         print(f"\n--- Cycle {cycle + 1} ---")
         
         # Execute trading cycles
-        agent.execute_trading_cycle(task1_id)
-        agent.execute_trading_cycle(task2_id)
+        await agent.execute_trading_cycles([task1_id, task2_id])
         
         # Get task status
         task1 = agent.get_task_status(task1_id)
@@ -8,8 +8,37 @@ import json
 from datetime import datetime, timedelta
 from robo_trading_agent import RoboTradingAgent, AssetType, TradingStatus
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 class RoboTradingInterface:
     """User-friendly interface for the robo trading agent."""
+
+    _ASSET_TYPES = {
+        1: AssetType.STOCK,
+        2: AssetType.CRYPTO,
+        3: AssetType.FOREX,
+        4: AssetType.COMMODITY,
+        5: AssetType.ETF
+    }
+    _RISK_LEVELS = {1: "low", 2: "medium", 3: "high"}
+    _STATUS_EMOJI = {
+        TradingStatus.IDLE: "⚪",
+        TradingStatus.MONITORING: "🟢",
+        TradingStatus.TARGET_REACHED: "🎯",
+        TradingStatus.STOPPED: "🔴",
+        TradingStatus.ERROR: "❌"
+    }
+    _DEFAULT_SYMBOLS = {
+        AssetType.STOCK: ("AAPL", "TSLA", "MSFT", "GOOGL", "NVDA"),
+        AssetType.CRYPTO: ("BTC", "ETH", "SOL", "ADA", "DOT"),
+        AssetType.FOREX: ("EUR/USD", "GBP/USD", "USD/JPY", "USD/CHF"),
+        AssetType.COMMODITY: ("GOLD", "SILVER", "OIL", "NATURAL_GAS"),
+        AssetType.ETF: ("SPY", "QQQ", "IWM", "VTI", "VEA")
+    }
     
     def __init__(self):
         self.agent = RoboTradingAgent("SmartTrader")
@@ -87,35 +116,18 @@ class RoboTradingInterface:
         print("5. ETF")
         
         asset_choice = self.get_user_input("Select asset type (1-5): ", "int")
-        asset_types = {
-            1: AssetType.STOCK,
-            2: AssetType.CRYPTO,
-            3: AssetType.FOREX,
-            4: AssetType.COMMODITY,
-            5: AssetType.ETF
-        }
-        
-        asset_type = asset_types.get(asset_choice, AssetType.STOCK)
+        asset_type = self._ASSET_TYPES.get(asset_choice, AssetType.STOCK)
         
         # Get symbols
-        if asset_type == AssetType.STOCK:
-            default_symbols = "AAPL,TSLA,MSFT,GOOGL,NVDA"
-        elif asset_type == AssetType.CRYPTO:
-            default_symbols = "BTC,ETH,SOL,ADA,DOT"
-        elif asset_type == AssetType.FOREX:
-            default_symbols = "EUR/USD,GBP/USD,USD/JPY,USD/CHF"
-        elif asset_type == AssetType.COMMODITY:
-            default_symbols = "GOLD,SILVER,OIL,NATURAL_GAS"
-        else:
-            default_symbols = "SPY,QQQ,IWM,VTI,VEA"
+        default_symbols = self._DEFAULT_SYMBOLS[asset_type]
         
-        print(f"📊 Default symbols for {asset_type.value}: {default_symbols}")
+        print(f"📊 Default symbols for {asset_type.value}: {', '.join(default_symbols)}")
         symbols_input = self.get_user_input(f"Enter symbols (comma-separated) or press Enter for defaults: ")
         
         if symbols_input.strip():
             symbols = self.get_user_input("", "list")
         else:
-            symbols = default_symbols.split(",")
+            symbols = list(default_symbols)
         
         # Get duration
         duration_hours = self.get_user_input("⏰ Duration (hours, default 8): ", "int")
@@ -129,8 +141,7 @@ class RoboTradingInterface:
         print("3. High (Aggressive)")
         
         risk_choice = self.get_user_input("Select risk tolerance (1-3, default 2): ", "int")
-        risk_levels = {1: "low", 2: "medium", 3: "high"}
-        risk_tolerance = risk_levels.get(risk_choice, "medium")
+        risk_tolerance = self._RISK_LEVELS.get(risk_choice, "medium")
         
         # Create task
         try:
@@ -230,13 +241,7 @@ class RoboTradingInterface:
         
         print("📋 All Tasks:")
         for i, task in enumerate(tasks, 1):
-            status_emoji = {
-                TradingStatus.IDLE: "⚪",
-                TradingStatus.MONITORING: "🟢",
-                TradingStatus.TARGET_REACHED: "🎯",
-                TradingStatus.STOPPED: "🔴",
-                TradingStatus.ERROR: "❌"
-            }.get(task.status, "❓")
+            status_emoji = self._STATUS_EMOJI.get(task.status, "❓")
             
             print(f"{i}. {status_emoji} {task.id}")
             print(f"   💰 ${task.current_balance:.2f} / ${task.target_amount:.2f}")
@@ -453,6 +458,8 @@ class RoboTradingInterface:
 
 def main():
     """Main function."""
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     interface = RoboTradingInterface()
     asyncio.run(interface.run_interface())
 
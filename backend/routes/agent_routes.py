@@ -7,12 +7,28 @@ API endpoints for agent operations, customer management, and trading suggestions
 import os
 import sys
 import asyncio
-from flask import Blueprint, request, jsonify
+import concurrent.futures
+import threading
+import weakref
+from flask import Blueprint, Response, request, jsonify
 from functools import wraps
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from database import db_manager
 from middleware.auth_middleware import require_auth, require_role
 from models.user import UserRole
 from services.agent_service import agent_service
@@ -20,16 +36,39 @@ from services.trading_suggestion_service import trading_suggestion_service
 
 agent_bp = Blueprint('agent', __name__, url_prefix='/api/agent')
 
+# uvloop is a drop-in replacement for the default selector loop when installed
+_new_event_loop = uvloop.new_event_loop if UVLOOP_AVAILABLE else asyncio.new_event_loop
+
+# Each worker thread creates its loop once and reuses it for later requests.
+# The awaited services still make blocking yfinance/DB calls, so a shared
+# loop would let one slow request stall every async route.
+_thread_state = threading.local()
+
+def _get_thread_loop():
+    """Return this thread's event loop, creating it on first use"""
+    loop = getattr(_thread_state, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = _new_event_loop()
+        _thread_state.loop = loop
+        # Close the loop once the worker thread has gone away
+        weakref.finalize(threading.current_thread(), loop.close)
+    return loop
+
+def ojsonify(obj, status=200):
+    """jsonify replacement that serializes with orjson when it is installed; always returns a Response"""
+    if not ORJSON_AVAILABLE:
+        response = jsonify(obj)
+        response.status_code = status
+        return response
+    return Response(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY), status=status, mimetype='application/json')
+
 def async_route(f):
     """Decorator to handle async functions in Flask routes"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        loop = asyncio.new_event_loop()
+        loop = _get_thread_loop()
         asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(f(*args, **kwargs))
-        finally:
-            loop.close()
+        return loop.run_until_complete(f(*args, **kwargs))
     return decorated_function
 
 @agent_bp.route('/dashboard', methods=['GET'])
@@ -212,42 +251,74 @@ def get_pending_suggestions():
         agent_id = request.user['id']
 
         # This would query the database for pending suggestions
-        from database import db_manager
         from models.agent_models import TradingSuggestion, SuggestionStatus
 
+        # Select only the serialized columns so rows skip ORM hydration
         with db_manager.get_session() as session:
-            suggestions = session.query(TradingSuggestion).filter_by(
+            rows = session.query(
+                TradingSuggestion.id,
+                TradingSuggestion.symbol,
+                TradingSuggestion.suggestion_type,
+                TradingSuggestion.suggested_quantity,
+                TradingSuggestion.suggested_price,
+                TradingSuggestion.current_price,
+                TradingSuggestion.ai_confidence,
+                TradingSuggestion.predicted_return,
+                TradingSuggestion.risk_score,
+                TradingSuggestion.reasoning,
+                TradingSuggestion.priority,
+                TradingSuggestion.created_at,
+                TradingSuggestion.valid_until,
+                TradingSuggestion.portfolio_id
+            ).filter_by(
                 agent_id=agent_id,
                 status=SuggestionStatus.PENDING
             ).order_by(TradingSuggestion.priority.desc(), TradingSuggestion.created_at.desc()).all()
 
-            suggestions_data = []
-            for s in suggestions:
-                suggestions_data.append({
-                    'id': s.id,
-                    'symbol': s.symbol,
-                    'suggestion_type': s.suggestion_type.value,
-                    'suggested_quantity': s.suggested_quantity,
-                    'suggested_price': s.suggested_price,
-                    'current_price': s.current_price,
-                    'ai_confidence': s.ai_confidence,
-                    'predicted_return': s.predicted_return,
-                    'risk_score': s.risk_score,
-                    'reasoning': s.reasoning,
-                    'priority': s.priority,
-                    'created_at': s.created_at.isoformat() if s.created_at else None,
-                    'valid_until': s.valid_until.isoformat() if s.valid_until else None,
-                    'portfolio_id': s.portfolio_id
-                })
-
-        return jsonify({'suggestions': suggestions_data})
+        suggestions_data = [{
+            'id': r.id,
+            'symbol': r.symbol,
+            'suggestion_type': r.suggestion_type.value,
+            'suggested_quantity': r.suggested_quantity,
+            'suggested_price': r.suggested_price,
+            'current_price': r.current_price,
+            'ai_confidence': r.ai_confidence,
+            'predicted_return': r.predicted_return,
+            'risk_score': r.risk_score,
+            'reasoning': r.reasoning,
+            'priority': r.priority,
+            'created_at': r.created_at.isoformat() if r.created_at else None,
+            'valid_until': r.valid_until.isoformat() if r.valid_until else None,
+            'portfolio_id': r.portfolio_id
+        } for r in rows]
+
+        return ojsonify({'suggestions': suggestions_data})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Approve/reject calls from every request thread share this pool, which caps
+# concurrent DB work process-wide. SQLite shares a single connection
+# (StaticPool), so it gets one worker.
+_BATCH_CONCURRENCY = 8
+_batch_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1 if db_manager.database_url.startswith('sqlite') else _BATCH_CONCURRENCY,
+    thread_name_prefix='agent-batch'
+)
+
+def _suggestion_portfolio_ids(suggestion_ids):
+    """Map each existing suggestion id to its portfolio id"""
+    from models.agent_models import TradingSuggestion
+
+    with db_manager.get_session() as session:
+        return dict(session.query(TradingSuggestion.id, TradingSuggestion.portfolio_id).filter(
+            TradingSuggestion.id.in_(suggestion_ids)
+        ).all())
+
 @agent_bp.route('/suggestions/batch-process', methods=['POST'])
 @require_auth
 @require_role(UserRole.AGENT)
-def batch_process_suggestions():
+@async_route
+async def batch_process_suggestions():
     """Process multiple suggestions at once"""
     try:
         agent_id = request.user['id']
@@ -256,33 +327,58 @@ def batch_process_suggestions():
         if not data or 'suggestions' not in data:
             return jsonify({'error': 'Missing suggestions data'}), 400
 
-        results = []
-        for suggestion_data in data['suggestions']:
+        loop = asyncio.get_running_loop()
+        suggestions = data['suggestions']
+
+        # Approving rewrites the portfolio's cash and holdings without row locks,
+        # so each portfolio's suggestions run one at a time, in request order.
+        # A repeated id lands in the same group and finds the suggestion already
+        # processed. Unknown ids share one group.
+        suggestion_ids = [s.get('id') for s in suggestions if isinstance(s.get('id'), int)]
+        portfolio_ids = {}
+        if suggestion_ids:
+            portfolio_ids = await loop.run_in_executor(_batch_executor, _suggestion_portfolio_ids, suggestion_ids)
+        groups = {}
+        for index, suggestion_data in enumerate(suggestions):
+            suggestion_id = suggestion_data.get('id')
+            portfolio_id = portfolio_ids.get(suggestion_id) if isinstance(suggestion_id, int) else None
+            groups.setdefault(portfolio_id, []).append(index)
+
+        async def process(suggestion_data):
             suggestion_id = suggestion_data.get('id')
             action = suggestion_data.get('action')  # 'approve' or 'reject'
             notes = suggestion_data.get('notes', '')
 
             try:
                 if action == 'approve':
-                    result = agent_service.approve_suggestion(suggestion_id, agent_id, notes)
+                    handler = agent_service.approve_suggestion
                 elif action == 'reject':
-                    result = agent_service.reject_suggestion(suggestion_id, agent_id, notes)
+                    handler = agent_service.reject_suggestion
                 else:
-                    result = {'success': False, 'error': 'Invalid action'}
+                    handler = None
 
-                results.append({
-                    'suggestion_id': suggestion_id,
-                    'action': action,
-                    'result': result
-                })
+                if handler is None:
+                    result = {'success': False, 'error': 'Invalid action'}
+                else:
+                    result = await loop.run_in_executor(_batch_executor, handler, suggestion_id, agent_id, notes)
             except Exception as e:
-                results.append({
-                    'suggestion_id': suggestion_id,
-                    'action': action,
-                    'result': {'success': False, 'error': str(e)}
-                })
+                result = {'success': False, 'error': str(e)}
 
-        return jsonify({
+            return {
+                'suggestion_id': suggestion_id,
+                'action': action,
+                'result': result
+            }
+
+        results = [None] * len(suggestions)
+
+        async def process_group(indices):
+            for index in indices:
+                results[index] = await process(suggestions[index])
+
+        await asyncio.gather(*(process_group(indices) for indices in groups.values()))
+
+        return ojsonify({
             'success': True,
             'processed': len(results),
             'results': results
@@ -293,12 +389,12 @@ def batch_process_suggestions():
 # Error handlers
 @agent_bp.errorhandler(404)
 def not_found(error):
-    return jsonify({'error': 'Resource not found'}), 404
+    return ojsonify({'error': 'Resource not found'}, 404)
 
 @agent_bp.errorhandler(403)
 def forbidden(error):
-    return jsonify({'error': 'Access denied'}), 403
+    return ojsonify({'error': 'Access denied'}, 403)
 
 @agent_bp.errorhandler(500)
 def internal_error(error):
-    return jsonify({'error': 'Internal server error'}), 500
\ No newline at end of file
+    return ojsonify({'error': 'Internal server error'}, 500)
\ No newline at end of file
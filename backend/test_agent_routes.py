@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Agent Routes
+Tests the async route plumbing without a database or AI backend
+"""
+
+import unittest
+import sys
+import os
+import threading
+import time
+import types
+import concurrent.futures
+from unittest.mock import MagicMock, patch
+
+# Add the current directory to the path to import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from flask import Flask, request
+
+# The real services load the AI predictor (config, yfinance, Gemini) at import.
+# Every service call is patched below, so stand-in modules are enough.
+for module_name, service_name in (('services.trading_suggestion_service', 'trading_suggestion_service'),
+                                  ('services.agent_service', 'agent_service')):
+    if module_name not in sys.modules:
+        stub = types.ModuleType(module_name)
+        setattr(stub, service_name, MagicMock())
+        sys.modules[module_name] = stub
+
+from routes import agent_routes
+
+
+def unwrap_auth(view):
+    """Strip require_auth/require_role, leaving the async_route wrapper"""
+    return view.__wrapped__.__wrapped__
+
+
+class TestAsyncRoutes(unittest.TestCase):
+    """Test that async routes don't block each other"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.app = Flask(__name__)
+        self.app.register_blueprint(agent_routes.agent_bp)
+
+    def call_view(self, view, path, payload=None, **kwargs):
+        """Run a view inside a request context as agent 1"""
+        with self.app.test_request_context(path, method='POST', json=payload):
+            request.user = {'id': 1}
+            return unwrap_auth(view)(**kwargs)
+
+    def test_batch_not_blocked_by_slow_generate(self):
+        """A batch request completes while a generate request is stuck in blocking I/O"""
+        generate_started = threading.Event()
+        release_generate = threading.Event()
+        generate_result = {}
+
+        async def slow_generate(portfolio_id):
+            generate_started.set()
+            # Blocking call, like the yfinance lookups in the real service
+            release_generate.wait(10)
+            return []
+
+        def run_generate():
+            generate_result['response'] = self.call_view(
+                agent_routes.generate_portfolio_suggestions,
+                '/api/agent/portfolios/7/suggestions/generate',
+                portfolio_id=7
+            )
+
+        with patch.object(agent_routes.trading_suggestion_service, 'generate_suggestions_for_portfolio', slow_generate), \
+             patch.object(agent_routes.agent_service, 'get_portfolio_details', return_value={}), \
+             patch.object(agent_routes.agent_service, 'approve_suggestion', return_value={'success': True}), \
+             patch.object(agent_routes.agent_service, 'reject_suggestion', return_value={'success': True}), \
+             patch.object(agent_routes, '_suggestion_portfolio_ids', return_value={1: 10, 2: 10}):
+            generate_thread = threading.Thread(target=run_generate)
+            generate_thread.start()
+            try:
+                self.assertTrue(generate_started.wait(5))
+
+                start = time.perf_counter()
+                response = self.call_view(
+                    agent_routes.batch_process_suggestions,
+                    '/api/agent/suggestions/batch-process',
+                    {'suggestions': [
+                        {'id': 1, 'action': 'approve'},
+                        {'id': 2, 'action': 'reject', 'notes': 'too risky'},
+                        {'id': 3, 'action': 'hold'}
+                    ]}
+                )
+                elapsed = time.perf_counter() - start
+
+                self.assertFalse(release_generate.is_set())
+                self.assertLess(elapsed, 5)
+            finally:
+                release_generate.set()
+                generate_thread.join(10)
+
+        data = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['processed'], 3)
+        self.assertEqual([r['suggestion_id'] for r in data['results']], [1, 2, 3])
+        self.assertEqual(data['results'][0]['result'], {'success': True})
+        self.assertEqual(data['results'][2]['result'], {'success': False, 'error': 'Invalid action'})
+        self.assertTrue(generate_result['response'].get_json()['success'])
+
+    def test_batch_runs_each_portfolio_in_order(self):
+        """A portfolio's suggestions never run at once, so a repeated id is already processed"""
+        portfolios = {1: 10, 2: 10, 3: 20, 4: 20}
+        lock = threading.Lock()
+        running = set()
+        overlaps = []
+        processed = []
+
+        def handle(suggestion_id, agent_id, notes):
+            portfolio_id = portfolios.get(suggestion_id)
+            with lock:
+                if portfolio_id is None or suggestion_id in processed:
+                    raise ValueError("Suggestion not found or already processed")
+                if portfolio_id in running:
+                    overlaps.append(suggestion_id)
+                running.add(portfolio_id)
+            time.sleep(0.05)
+            with lock:
+                running.discard(portfolio_id)
+                processed.append(suggestion_id)
+            return {'success': True}
+
+        def lookup(suggestion_ids):
+            return {i: portfolios[i] for i in suggestion_ids if i in portfolios}
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+        try:
+            with patch.object(agent_routes, '_batch_executor', executor), \
+                 patch.object(agent_routes, '_suggestion_portfolio_ids', lookup), \
+                 patch.object(agent_routes.agent_service, 'approve_suggestion', handle), \
+                 patch.object(agent_routes.agent_service, 'reject_suggestion', handle):
+                response = self.call_view(
+                    agent_routes.batch_process_suggestions,
+                    '/api/agent/suggestions/batch-process',
+                    {'suggestions': [
+                        {'id': 1, 'action': 'approve'},
+                        {'id': 3, 'action': 'approve'},
+                        {'id': 2, 'action': 'approve'},
+                        {'id': 1, 'action': 'approve'},
+                        {'id': 4, 'action': 'reject'},
+                        {'id': 99, 'action': 'approve'}
+                    ]}
+                )
+        finally:
+            executor.shutdown()
+
+        results = response.get_json()['results']
+        self.assertEqual(overlaps, [])
+        self.assertEqual([r['suggestion_id'] for r in results], [1, 3, 2, 1, 4, 99])
+        self.assertEqual([r['result']['success'] for r in results], [True, True, True, False, True, False])
+        self.assertEqual(results[3]['result']['error'], "Suggestion not found or already processed")
+        # Each portfolio's suggestions ran in request order
+        self.assertEqual([i for i in processed if portfolios[i] == 10], [1, 2])
+        self.assertEqual([i for i in processed if portfolios[i] == 20], [3, 4])
+
+    def test_thread_reuses_its_loop(self):
+        """Consecutive async requests on one thread share a loop"""
+        first = agent_routes._get_thread_loop()
+        self.assertIs(agent_routes._get_thread_loop(), first)
+
+        other = []
+        worker = threading.Thread(target=lambda: other.append(agent_routes._get_thread_loop()))
+        worker.start()
+        worker.join()
+        self.assertIsNot(other[0], first)
+
+
+if __name__ == '__main__':
+    unittest.main()
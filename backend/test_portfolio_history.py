@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Portfolio History Storage
+Tests the signal ring buffer, the performance history columns and the
+performance log written beside saved portfolio state
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime, timedelta
+
+# Add the current directory to the path to import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from portfolio_manager import (
+    PortfolioManager, PerformanceHistory, Signal, SignalStore, SignalType,
+    _history_log_filename
+)
+
+
+def make_signal(i):
+    """Build a distinguishable signal for position i"""
+    return Signal(
+        symbol=f"SYM{i}",
+        signal_type=SignalType.BUY if i % 2 else SignalType.SELL,
+        confidence=i / 100,
+        price=100.0 + i,
+        timestamp=datetime(2024, 1, 1) + timedelta(minutes=i),
+        reasoning=f"reason {i}",
+        target_price=None if i % 3 else 110.0 + i,
+        stop_loss=90.0 + i
+    )
+
+
+def make_record(day, value):
+    """Build a performance record for day offset `day`"""
+    return {
+        'date': datetime(2024, 1, 1) + timedelta(days=day),
+        'total_value': value,
+        'total_return': value / 1000 - 1,
+        'daily_return': 0.01,
+        'available_cash': 500.0,
+        'num_assets': day % 4
+    }
+
+
+class TestSignalStore(unittest.TestCase):
+    """Test the bounded signal ring buffer"""
+
+    def test_wraps_around_keeping_newest(self):
+        """Once full, the oldest signals are overwritten in order"""
+        store = SignalStore(capacity=5)
+        for i in range(12):
+            store.append(make_signal(i))
+
+        self.assertEqual(len(store), 5)
+        self.assertEqual([s.symbol for s in store], [f"SYM{i}" for i in range(7, 12)])
+        self.assertEqual(store[0], make_signal(7))
+        self.assertEqual(store[-1], make_signal(11))
+        self.assertEqual([s.symbol for s in store[-2:]], ["SYM10", "SYM11"])
+
+    def test_grows_before_wrapping(self):
+        """The columns grow past their initial size up to the capacity"""
+        store = SignalStore(capacity=100)
+        for i in range(150):
+            store.append(make_signal(i))
+
+        self.assertEqual(len(store), 100)
+        self.assertEqual(list(store), [make_signal(i) for i in range(50, 150)])
+
+    def test_optional_prices_round_trip(self):
+        """Missing target prices come back as None"""
+        store = SignalStore(capacity=3)
+        store.append(make_signal(1))
+        store.append(make_signal(3))
+
+        self.assertIsNone(store[0].target_price)
+        self.assertEqual(store[1].target_price, 113.0)
+        self.assertEqual(store[1].signal_type, SignalType.BUY)
+
+
+class TestPerformanceHistory(unittest.TestCase):
+    """Test the columnar performance history"""
+
+    def test_append_past_initial_allocation(self):
+        """Records survive the columns being reallocated"""
+        history = PerformanceHistory()
+        records = [make_record(day, 1000.0 + day) for day in range(200)]
+        for record in records:
+            history.append(record)
+
+        self.assertEqual(len(history), 200)
+        self.assertEqual(history[:], records)
+        self.assertEqual(history[-1], records[-1])
+
+    def test_since_is_inclusive(self):
+        """since() returns records dated at or after the cutoff"""
+        history = PerformanceHistory()
+        for day in range(10):
+            history.append(make_record(day, 1000.0 + day))
+
+        since = history.since(datetime(2024, 1, 8))
+        self.assertEqual([r['total_value'] for r in since], [1007.0, 1008.0, 1009.0])
+        self.assertEqual(history.since(datetime(2025, 1, 1)), [])
+
+
+class TestPerformanceHistoryPersistence(unittest.TestCase):
+    """Test the performance log written beside the state file"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.state_file = os.path.join(self.temp_dir, 'state.json')
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_history_survives_restart(self):
+        """A new manager loads the full history written across several saves"""
+        manager = PortfolioManager(10000)
+        for _ in range(3):
+            manager.track_performance()
+        manager.save_portfolio_state(self.state_file)
+
+        # Later saves only append the new records
+        for _ in range(2):
+            manager.track_performance()
+        manager.save_portfolio_state(self.state_file)
+
+        self.assertTrue(os.path.exists(_history_log_filename(self.state_file)))
+
+        restarted = PortfolioManager(5000)
+        restarted.load_portfolio_state(self.state_file)
+
+        self.assertEqual(len(restarted.portfolio.performance_history), 5)
+        self.assertEqual(restarted.portfolio.performance_history[:],
+                         manager.portfolio.performance_history[:])
+
+        # Saving after the restart keeps appending to the same log
+        restarted.track_performance()
+        restarted.save_portfolio_state(self.state_file)
+        reloaded = PortfolioManager(5000)
+        reloaded.load_portfolio_state(self.state_file)
+        self.assertEqual(len(reloaded.portfolio.performance_history), 6)
+
+    def test_partial_last_record_is_skipped(self):
+        """A log cut short mid-append still loads, and the next save repairs it"""
+        manager = PortfolioManager(10000)
+        for _ in range(3):
+            manager.track_performance()
+        manager.save_portfolio_state(self.state_file)
+
+        log_filename = _history_log_filename(self.state_file)
+        with open(log_filename, 'rb') as f:
+            data = f.read()
+        with open(log_filename, 'wb') as f:
+            f.write(data[:-10])
+
+        restarted = PortfolioManager(5000)
+        restarted.load_portfolio_state(self.state_file)
+        self.assertEqual(restarted.initial_capital, 10000)
+        self.assertEqual(restarted.portfolio.performance_history[:],
+                         manager.portfolio.performance_history[:2])
+
+        restarted.track_performance()
+        restarted.save_portfolio_state(self.state_file)
+        reloaded = PortfolioManager(5000)
+        reloaded.load_portfolio_state(self.state_file)
+        self.assertEqual(reloaded.portfolio.performance_history[:],
+                         restarted.portfolio.performance_history[:])
+
+    def test_bad_log_leaves_portfolio_untouched(self):
+        """A log that can't be read doesn't half-load the state"""
+        manager = PortfolioManager(10000)
+        manager.track_performance()
+        manager.save_portfolio_state(self.state_file)
+        with open(_history_log_filename(self.state_file), 'wb') as f:
+            f.write(b'{"date": \n')
+
+        other = PortfolioManager(5000)
+        other.load_portfolio_state(self.state_file)
+        self.assertEqual(other.initial_capital, 5000)
+        self.assertEqual(other.portfolio.available_cash, 5000)
+
+    def test_concurrent_saves_append_once(self):
+        """Saves from several threads write each record to the log once"""
+        manager = PortfolioManager(10000)
+        manager.track_performance()
+        manager.save_portfolio_state(self.state_file)
+        for _ in range(5):
+            manager.track_performance()
+
+        threads = [threading.Thread(target=manager.save_portfolio_state, args=(self.state_file,))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        restarted = PortfolioManager(5000)
+        restarted.load_portfolio_state(self.state_file)
+        self.assertEqual(len(restarted.portfolio.performance_history), 6)
+
+    def test_gzip_state_round_trip(self):
+        """Compressed state files keep their history too"""
+        state_file = self.state_file + '.gz'
+        manager = PortfolioManager(10000)
+        manager.track_performance()
+        manager.save_portfolio_state(state_file)
+
+        restarted = PortfolioManager(5000)
+        restarted.load_portfolio_state(state_file)
+        self.assertEqual(restarted.portfolio.performance_history[:],
+                         manager.portfolio.performance_history[:])
+
+
+class TestPerformanceHistoryCutoff(unittest.TestCase):
+    """Test the day window used by get_performance_history"""
+
+    def test_zero_days_returns_nothing(self):
+        """Records tracked before the call fall outside a zero-day window"""
+        manager = PortfolioManager(10000)
+        manager.track_performance()
+
+        self.assertEqual(manager.get_performance_history(0), [])
+        self.assertEqual(len(manager.get_performance_history(30)), 1)
+
+    def test_window_excludes_older_records(self):
+        """Only records inside the window are returned"""
+        manager = PortfolioManager(10000)
+        now = datetime.now()
+        for days_ago in (40, 20, 1):
+            record = make_record(0, 10000.0)
+            record['date'] = now - timedelta(days=days_ago)
+            manager.portfolio.performance_history.append(record)
+
+        self.assertEqual(len(manager.get_performance_history(30)), 2)
+        self.assertEqual(len(manager.get_performance_history(7)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Robo Trading Agent Storage
+Tests the price ring buffer behind the technical indicators, the columnar
+trade log and task ids, without running any trading cycles
+"""
+
+import unittest
+import sys
+import os
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add the current directory to the path to import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from robo_trading_agent import (
+    AssetType, PriceHistory, RoboTradingAgent, TechnicalAnalyzer, TradeLog
+)
+
+
+def make_trade(i, task_id):
+    """Build a buy or sell trade log dict shaped like the agent's"""
+    trade = {
+        'task_id': task_id,
+        'order_id': f"order_{i}",
+        'symbol': 'AAPL' if i % 2 else 'BTC',
+        'side': 'sell' if i % 3 == 0 else 'buy',
+        'quantity': float(i + 1),
+        'price': 100.0 + i,
+        'value': (i + 1) * (100.0 + i),
+        'commission': 0.5 + i / 10
+    }
+    timestamp = datetime(2024, 1, 1) + timedelta(seconds=i)
+    if trade['side'] == 'sell':
+        trade['pnl'] = i - 10.0
+        trade['exit_reason'] = 'take_profit'
+        trade['timestamp'] = timestamp
+    else:
+        trade['timestamp'] = timestamp
+        trade['signals'] = {'overall_signal': 'buy'}
+    return trade
+
+
+class TestPriceHistory(unittest.TestCase):
+    """Test the fixed-capacity price ring buffer"""
+
+    def test_wraps_around_keeping_newest(self):
+        """Once full, the oldest prices are overwritten in order"""
+        history = PriceHistory(capacity=10, sma_periods=(3,), rsi_period=4)
+        for price in range(25):
+            history.append(float(price))
+
+        self.assertEqual(len(history), 10)
+        self.assertEqual(history.head, 25)
+        self.assertEqual(history.latest, 24.0)
+        self.assertEqual(history.last(10).tolist(), [float(p) for p in range(15, 25)])
+        # A window that crosses the end of the buffer
+        self.assertEqual(history.last(7).tolist(), [float(p) for p in range(18, 25)])
+
+    def test_rolling_sums_match_buffer_across_wraps(self):
+        """Rolling SMA and RSI sums agree with recomputation over many wraps"""
+        rng = random.Random(7)
+        history = PriceHistory(capacity=30, sma_periods=(5, 10), rsi_period=6)
+        price = 100.0
+        for step in range(300):
+            price = max(1.0, price + rng.choice([-2.5, -1.0, 0.0, 1.0, 3.0]))
+            history.append(price)
+
+            for period in (5, 10):
+                if len(history) >= period:
+                    self.assertAlmostEqual(history.moving_sum(period), history.last(period).sum(), places=6)
+
+            if len(history) > 6:
+                changes = np.diff(history.last(7))
+                gain_sum, loss_sum = history.rsi_sums()
+                self.assertAlmostEqual(gain_sum, changes[changes > 0].sum(), places=6)
+                self.assertAlmostEqual(loss_sum, -changes[changes < 0].sum(), places=6)
+
+    def test_untracked_window_has_no_sum(self):
+        """Only the configured SMA windows keep rolling sums"""
+        history = PriceHistory(capacity=10, sma_periods=(3,))
+        history.append(1.0)
+        self.assertIsNone(history.moving_sum(7))
+
+
+class TestTechnicalAnalyzerIndicators(unittest.TestCase):
+    """Test indicators computed from the ring buffer"""
+
+    def setUp(self):
+        """Feed more prices than the 100-point history keeps"""
+        self.analyzer = TechnicalAnalyzer()
+        rng = random.Random(11)
+        self.prices = [100.0]
+        for _ in range(249):
+            self.prices.append(max(1.0, self.prices[-1] * (1 + rng.uniform(-0.03, 0.03))))
+        start = datetime(2024, 1, 1)
+        for i, price in enumerate(self.prices):
+            self.analyzer.add_price_data('AAPL', price, start + timedelta(minutes=i))
+
+    def expected_rsi(self, period):
+        """RSI over the last `period` changes of the raw price list"""
+        changes = np.diff(self.prices[-(period + 1):])
+        avg_gain = changes[changes > 0].sum() / period
+        avg_loss = -changes[changes < 0].sum() / period
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+    def test_rsi_matches_full_recomputation(self):
+        """RSI from the rolling sums equals RSI from the raw prices"""
+        self.assertAlmostEqual(self.analyzer.calculate_rsi('AAPL'), self.expected_rsi(14), places=6)
+        self.assertAlmostEqual(self.analyzer.calculate_rsi('AAPL', period=9), self.expected_rsi(9), places=6)
+
+    def test_moving_averages_use_latest_prices(self):
+        """Moving averages cover only the most recent prices"""
+        for period in (20, 50, 30):
+            self.assertAlmostEqual(self.analyzer.calculate_moving_average('AAPL', period),
+                                   float(np.mean(self.prices[-period:])), places=6)
+        self.assertIsNone(self.analyzer.calculate_moving_average('AAPL', 150))
+
+
+class TestTradeLog(unittest.TestCase):
+    """Test the columnar trade log"""
+
+    def setUp(self):
+        """Log more trades than the initial allocation, across two tasks"""
+        self.log = TradeLog()
+        self.trades = [make_trade(i, 'task_a' if i % 4 else 'task_b') for i in range(150)]
+        for trade in self.trades:
+            self.log.append(trade)
+
+    def test_records_round_trip(self):
+        """Trades come back as the same dicts, with the same key order"""
+        self.assertEqual(len(self.log), 150)
+        records = self.log[:]
+        self.assertEqual(records, self.trades)
+        self.assertEqual([list(r) for r in records], [list(t) for t in self.trades])
+        self.assertEqual(self.log[-1], self.trades[-1])
+
+    def test_per_task_reductions(self):
+        """Row selection, side counts and totals match a plain-list scan"""
+        rows = self.log.rows_for_task('task_b')
+        expected = [t for t in self.trades if t['task_id'] == 'task_b']
+
+        self.assertEqual(self.log.records(rows), expected)
+        buys, sells = self.log.side_counts(rows)
+        self.assertEqual(buys, sum(t['side'] == 'buy' for t in expected))
+        self.assertEqual(sells, sum(t['side'] == 'sell' for t in expected))
+        self.assertAlmostEqual(self.log.total('value', rows), sum(t['value'] for t in expected))
+        self.assertAlmostEqual(self.log.total('commission', rows), sum(t['commission'] for t in expected))
+        self.assertEqual(len(self.log.rows_for_task('missing')), 0)
+
+
+class TestRoboAgentIds(unittest.TestCase):
+    """Test task id generation"""
+
+    def test_ids_unique_across_agents(self):
+        """Agents created together never hand out the same task id"""
+        agents = [RoboTradingAgent(f"Agent{i}") for i in range(3)]
+        task_ids = [
+            agent.create_trading_task(1000.0, 1100.0, AssetType.STOCK, ['AAPL'])
+            for agent in agents for _ in range(2)
+        ]
+        self.assertEqual(len(set(task_ids)), len(task_ids))
+
+
+if __name__ == '__main__':
+    unittest.main()